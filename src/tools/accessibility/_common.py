@@ -0,0 +1,44 @@
+"""
+Helpers shared by the accessibility audit tools.
+"""
+
+import argparse
+import itertools
+import os
+from typing import List
+from urllib.parse import urlsplit
+
+# Distinguishes files written within the same second by one process
+_file_counter = itertools.count()
+
+
+def file_suffix() -> str:
+    """Get a filename suffix that is unique across processes and within one.
+
+    The pid keeps runs started in the same second apart; the counter keeps
+    a run's own files apart.
+    """
+    return f'{os.getpid()}_{next(_file_counter)}'
+
+
+def url_domain(url: str) -> str:
+    """Get the host name of a URL for use in report filenames."""
+    return urlsplit(url).hostname or 'unknown'
+
+
+def positive_int(value: str) -> int:
+    """argparse type for options that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, not {value!r}")
+    return number
+
+
+def urls_from_file(path: str) -> List[str]:
+    """Read URLs from a file, one per line, skipping blank lines and # comments."""
+    with open(path) as f:
+        lines = (line.strip() for line in f)
+        return [line for line in lines if line and not line.startswith('#')]
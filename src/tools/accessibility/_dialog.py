@@ -0,0 +1,72 @@
+"""
+Native error dialogs for the accessibility tools.
+
+Each platform's own dialog mechanism is used, so showing an error doesn't
+need to start a Tcl/Tk interpreter.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+
+# Takes the message and title as arguments, so neither needs escaping
+_MACOS_DIALOG_SCRIPT = (
+    'on run argv',
+    'display dialog (item 1 of argv) with title (item 2 of argv) '
+    'buttons {"OK"} default button 1 with icon stop',
+    'end run',
+)
+
+MB_ICONERROR = 0x10
+
+
+def _macos_dialog(title: str, message: str) -> bool:
+    cmd = ['osascript']
+    for line in _MACOS_DIALOG_SCRIPT:
+        cmd += ['-e', line]
+    try:
+        return subprocess.run(cmd + [message, title], stdout=subprocess.DEVNULL,
+                              stderr=subprocess.DEVNULL).returncode == 0
+    except OSError:
+        return False
+
+
+def _windows_dialog(title: str, message: str) -> bool:
+    try:
+        import ctypes
+        ctypes.windll.user32.MessageBoxW(None, message, title, MB_ICONERROR)
+        return True
+    except (ImportError, AttributeError, OSError):
+        return False
+
+
+def _linux_dialog(title: str, message: str) -> bool:
+    if not (os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY')):
+        return False
+    # zenity shows a modal dialog; notify-send only a notification
+    if shutil.which('zenity'):
+        cmd = ['zenity', '--error', '--no-markup', '--title', title, '--text', message]
+    elif shutil.which('notify-send'):
+        cmd = ['notify-send', '--urgency=critical', title, message]
+    else:
+        return False
+    try:
+        # zenity exits with 1 when the dialog is closed rather than confirmed
+        return subprocess.run(cmd, stdout=subprocess.DEVNULL,
+                              stderr=subprocess.DEVNULL).returncode in (0, 1)
+    except OSError:
+        return False
+
+
+def show_native_error(title: str, message: str) -> bool:
+    """Show an error dialog using the platform's native mechanism.
+
+    Returns False if no dialog could be shown (e.g. there's no display),
+    so callers can fall back to printing the message.
+    """
+    if sys.platform == 'darwin':
+        return _macos_dialog(title, message)
+    if sys.platform == 'win32':
+        return _windows_dialog(title, message)
+    return _linux_dialog(title, message)
@@ -0,0 +1,91 @@
+"""
+Filesystem cache for axe-core audit results.
+
+Entries are keyed by the audited URL plus a fingerprint of the page content,
+so a cached result is only reused while the page itself is unchanged.
+"""
+
+import hashlib
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+DEFAULT_CACHE_DIR = Path.home() / '.axe-cache'
+DEFAULT_TTL = 3600  # seconds
+
+
+class FileCache:
+    """Store raw axe-core JSON output on disk with a time-to-live."""
+
+    def __init__(self, dir: Union[str, Path] = DEFAULT_CACHE_DIR, ttl: int = DEFAULT_TTL):
+        self.dir = Path(dir).expanduser()
+        self.ttl = ttl
+
+    def _path(self, key: str) -> Path:
+        return self.dir / f'{key}.json'
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached bytes for key, or None if missing or expired."""
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    def set(self, key: str, data: bytes) -> None:
+        """Store data under key."""
+        self.dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        # Write then rename, so readers never see a partial entry
+        tmp = path.with_name(f'{path.name}.tmp.{os.getpid()}')
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+
+def page_validator(url: str, timeout: float = 5) -> Optional[str]:
+    """Get the ETag or Last-Modified header for url from a HEAD request.
+
+    Returns None if the server sends neither or the page can't be reached.
+    """
+    import urllib.request  # Only needed once a page is fingerprinted
+
+    try:
+        request = urllib.request.Request(url, method='HEAD')
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.headers.get('ETag') or response.headers.get('Last-Modified')
+    except (OSError, ValueError):
+        return None
+
+
+def body_fingerprint(url: str, timeout: float = 5) -> Optional[str]:
+    """Get the SHA-256 of the page body at url, or None if it can't be fetched."""
+    import urllib.request
+
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return hashlib.sha256(response.read()).hexdigest()
+    except (OSError, ValueError):
+        return None
+
+
+def fingerprint_url(url: str, timeout: float = 5) -> Optional[str]:
+    """Get a cheap fingerprint of the page at url.
+
+    Uses the page's validator header (see page_validator) when the server
+    provides one, otherwise falls back to the SHA-256 of the response body.
+    Returns None if the page can't be fetched.
+    """
+    return page_validator(url, timeout) or body_fingerprint(url, timeout)
+
+
+def cache_key(url: str, fingerprint: str) -> str:
+    """Build the cache key for a URL and its content fingerprint."""
+    return hashlib.sha256(f'{url}|{fingerprint}'.encode('utf-8')).hexdigest()
@@ -3,191 +3,145 @@
 import os
 import sys
 import json
+import argparse
+import contextlib
+import functools
+import hashlib
+import getpass
+import shutil
+import time
 import subprocess
 import platform
+import tempfile
+import textwrap
+import threading
 from datetime import datetime
+from urllib.parse import urlsplit
 from pathlib import Path
-import pyperclip
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from dotenv import load_dotenv
-import html
-from typing import Optional
-
-# Initialize rich console first
-console = Console()
 
 # Add the project root to Python path for imports
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, "../../../.."))
 sys.path.insert(0, PROJECT_ROOT)
+from src.tools.accessibility._common import (
+    file_suffix, positive_int, url_domain, urls_from_file
+)
+from src.tools.accessibility._dialog import show_native_error
+from src.tools.accessibility.get_active_url import get_active_browser_url, race_active_url
 
-# Try to import tkinter, but have a fallback
+# ijson lets us parse axe output while it streams; fall back to json.load
 try:
-    import tkinter as tk
-    from tkinter import messagebox
-    HAS_TKINTER = True
+    import ijson
+    HAS_IJSON = True
+    JSON_ERRORS = (ValueError, ijson.JSONError)
 except ImportError:
-    HAS_TKINTER = False
-
-def get_active_url_macos() -> Optional[str]:
-    """Get URL from active browser window on macOS."""
-    # Try Chrome first
-    chrome_script = '''
-    tell application "Google Chrome"
-        if frontmost then
-            get URL of active tab of front window
-        end if
-    end tell
-    '''
-    
-    # Try Safari if Chrome fails
-    safari_script = '''
-    tell application "Safari"
-        if frontmost then
-            get URL of current tab of front window
-        end if
-    end tell
-    '''
-    
-    # Try Firefox if Safari fails
-    firefox_script = '''
-    tell application "Firefox"
-        if frontmost then
-            get URL of active tab of front window
-        end if
-    end tell
-    '''
-    
-    for script in [chrome_script, safari_script, firefox_script]:
-        try:
-            result = subprocess.run(
-                ['osascript', '-e', script],
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                return result.stdout.strip()
-        except subprocess.SubprocessError:
-            continue
-    
-    return None
+    HAS_IJSON = False
+    JSON_ERRORS = (ValueError,)
 
-def get_active_url_windows() -> Optional[str]:
-    """Get URL from active browser window on Windows."""
-    # PowerShell script to get URL from Chrome
-    chrome_script = r'''
-    Add-Type @"
-        using System;
-        using System.Runtime.InteropServices;
-        public class Win32 {
-            [DllImport("user32.dll")]
-            public static extern IntPtr GetForegroundWindow();
-            [DllImport("user32.dll")]
-            public static extern int GetWindowText(IntPtr hWnd, System.Text.StringBuilder text, int count);
-        }
-"@
-    $window = [Win32]::GetForegroundWindow()
-    $buffer = New-Object System.Text.StringBuilder(512)
-    [Win32]::GetWindowText($window, $buffer, $buffer.Capacity)
-    $title = $buffer.ToString()
-    
-    # Extract URL from common browser title formats
-    # Look for URLs in various browser title formats
-    foreach ($pattern in @(
-        "(?<url>https?://[^ -]+)",  # Basic URL pattern
-        "(?<url>https?://\S+) [-–] ",  # URL followed by dash
-        "[-–] (?<url>https?://\S+)$"  # URL at end after dash
-    )) {
-        if ($title -match $pattern) {
-            return $matches['url']
-        }
-    }
-    '''
-    
-    try:
-        result = subprocess.run(
-            ['powershell', '-Command', chrome_script],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            return result.stdout.strip()
-    except subprocess.SubprocessError:
-        pass
+# orjson parses and serialises several times faster than json; fall back to it
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
     
-    return None
+    def json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
 
-def get_active_url_linux() -> Optional[str]:
-    """Get URL from active browser window on Linux."""
-    # Try using xdotool to get window title
-    try:
-        # Get active window ID
-        window_id = subprocess.run(
-            ['xdotool', 'getactivewindow'],
-            capture_output=True,
-            text=True
-        ).stdout.strip()
-        
-        # Get window title
-        title = subprocess.run(
-            ['xdotool', 'getwindowname', window_id],
-            capture_output=True,
-            text=True
-        ).stdout.strip()
-        
-        # Extract URL from common browser title formats
-        import re
-        patterns = [
-            r'(?:https?://\S+)',  # Basic URL pattern
-            r'(?:https?://[^ ]+) [-–]',  # URL followed by dash
-            r'[-–] (?:https?://[^ ]+)$'  # URL at end after dash
-        ]
-        
-        for pattern in patterns:
-            url_match = re.search(pattern, title)
-            if url_match:
-                return url_match.group(0).rstrip('- ')
-                
-    except (subprocess.SubprocessError, FileNotFoundError):
-        pass
-    
-    return None
+# rich, dotenv, pyperclip, asyncio, the results cache and the sitemap parser
+# are imported where they're used, so paths that don't need them (e.g. --help
+# or a single uncached audit) don't pay their import cost
 
-def get_active_browser_url() -> Optional[str]:
-    """Get URL from active browser window based on current platform."""
-    if sys.platform == 'darwin':
-        return get_active_url_macos()
-    elif sys.platform == 'win32':
-        return get_active_url_windows()
-    elif sys.platform.startswith('linux'):
-        return get_active_url_linux()
-    return None
+@functools.lru_cache(maxsize=1)
+def _console():
+    """Get the shared rich console, importing rich on first use."""
+    from rich.console import Console
+    return Console()
+
+_TS_FMT = '%Y%m%d_%H%M%S'
+
+def _is_http_url(text):
+    """Check whether text is an absolute http(s) URL."""
+    parts = urlsplit(text)
+    return parts.scheme in ('http', 'https') and bool(parts.netloc)
 
 def show_error_dialog(message):
-    """Show an error message in a modal dialog or fallback to console."""
-    if HAS_TKINTER:
-        root = tk.Tk()
-        root.withdraw()  # Hide the main window
-        messagebox.showerror("Axe Audit Error", message)
-        root.destroy()
-    else:
-        console.print(Panel(f"[red]Error:[/red] {message}", title="Axe Audit Error", style="red"))
+    """Show an error message in a native dialog or fallback to console."""
+    if show_native_error("Axe Audit Error", message):
+        return
+    
+    from rich.panel import Panel
+    _console().print(Panel(f"[red]Error:[/red] {message}", title="Axe Audit Error", style="red"))
+
+def _clipboard_text_macos():
+    """Read the clipboard through AppKit, if PyObjC is installed."""
+    try:
+        from AppKit import NSPasteboard
+    except ImportError:
+        return None
+    return NSPasteboard.generalPasteboard().stringForType_('public.utf8-plain-text')
 
 def get_url_from_clipboard():
     """Get URL from clipboard with error handling."""
     try:
-        text = pyperclip.paste()
+        # On macOS, reading the pasteboard in-process avoids pyperclip's pbpaste fork
+        text = _clipboard_text_macos() if sys.platform == 'darwin' else None
+        if text is None:
+            import pyperclip
+            text = pyperclip.paste()
         # Basic URL validation
-        if text and any(text.startswith(prefix) for prefix in ['http://', 'https://']):
+        if text and _is_http_url(text):
             return text
     except:
         pass
     return None
 
+def _browser_url_or_none():
+    """Get the active browser's URL, or None if the lookup fails."""
+    try:
+        return get_active_browser_url()
+    except Exception as e:
+        _console().print(f"[dim]Error getting browser URL: {e}[/dim]")
+        return None
+
+AXE_NOT_FOUND_MSG = (
+    "axe-core CLI not found!\n\n"
+    "Please install it first:\n"
+    "1. Visit https://nodejs.org\n"
+    "2. Download and install Node.js\n"
+    "3. Open Terminal and run: npm install -g @axe-core/cli\n"
+    "4. Restart your terminal/IDE"
+)
+
+# How long a successful `axe --version` probe is trusted for
+AXE_PROBE_TTL = 24 * 60 * 60  # seconds
+
 def check_axe_cli():
     """Check if axe-core CLI is installed and working."""
+    # Look for the binary on PATH without spawning a process
+    axe_path = shutil.which('axe')
+    if axe_path is None:
+        show_error_dialog(AXE_NOT_FOUND_MSG)
+        return False
+    
+    # Skip the Node.js startup cost if this same binary worked recently. The
+    # probe records the resolved binary and its mtime, so reinstalling or
+    # upgrading the CLI invalidates it
+    probe_path = Path(tempfile.gettempdir()) / f'axe_cli_ok_{getpass.getuser()}'
+    try:
+        axe_real = os.path.realpath(axe_path)
+        axe_id = f'{axe_real}\n{os.stat(axe_real).st_mtime_ns}'
+    except OSError:
+        axe_id = None
+    try:
+        if (axe_id
+                and time.time() - probe_path.stat().st_mtime < AXE_PROBE_TTL
+                and probe_path.read_text() == axe_id):
+            return True
+    except OSError:
+        pass
+    
     try:
         # Try to get version info
         result = subprocess.run(['axe', '--version'], capture_output=True, text=True)
@@ -201,18 +155,16 @@ def check_axe_cli():
                 error_msg += f"\nError: {result.stderr}"
             show_error_dialog(error_msg)
             return False
-            
+        
+        if axe_id:
+            try:
+                probe_path.write_text(axe_id)
+            except OSError:
+                pass
         return True
         
     except FileNotFoundError:
-        show_error_dialog(
-            "axe-core CLI not found!\n\n"
-            "Please install it first:\n"
-            "1. Visit https://nodejs.org\n"
-            "2. Download and install Node.js\n"
-            "3. Open Terminal and run: npm install -g @axe-core/cli\n"
-            "4. Restart your terminal/IDE"
-        )
+        show_error_dialog(AXE_NOT_FOUND_MSG)
         return False
     except Exception as e:
         show_error_dialog(
@@ -222,34 +174,45 @@ def check_axe_cli():
         )
         return False
 
+@functools.lru_cache(maxsize=1)
 def setup_output_directory():
-    """Set up the output directory for reports and logs."""
-    reports_dir = os.getenv('AXE_REPORTS_DIR', os.path.expanduser('~/axe_reports'))
-    logs_dir = os.path.join(reports_dir, 'logs')
+    """Set up the output directory for reports and logs.
+    
+    The directories are only resolved and created once per process.
+    """
+    reports_dir = Path(os.getenv('AXE_REPORTS_DIR', Path.home() / 'axe_reports'))
+    logs_dir = reports_dir / 'logs'
     
     # Create directories if they don't exist
-    Path(reports_dir).mkdir(parents=True, exist_ok=True)
-    Path(logs_dir).mkdir(parents=True, exist_ok=True)
+    logs_dir.mkdir(parents=True, exist_ok=True)
+    
+    write_report_css(reports_dir)
     
     return reports_dir, logs_dir
 
-def generate_html_report(results, report_file):
-    """Generate an HTML report from axe-core results."""
-    if isinstance(results, list):
-        results = results[0]
-    
-    violations = results.get('violations', [])
-    incomplete = results.get('incomplete', [])
-    passes = results.get('passes', [])
-    
-    report_html = f"""<!DOCTYPE html>
+def write_report_css(reports_dir):
+    """Write the shared report stylesheet, unless an up-to-date copy exists."""
+    css = _REPORT_CSS_FILE
+    css_file = reports_dir / CSS_FILENAME
+    try:
+        if css_file.read_text() == css:
+            return
+    except OSError:
+        pass
+    css_file.write_text(css)
+
+# Static parts of the HTML report, built once at import time. The
+# templates use %-formatting, which is cheaper than str.format in the
+# per-issue loop
+_HTML_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Accessibility Audit Report</title>
-    <style>
-        :root {{
+"""
+
+_REPORT_CSS = """        :root {
             --color-text: #2c3e50;
             --color-background: #f5f5f5;
             --color-white: #ffffff;
@@ -269,27 +232,27 @@ def generate_html_report(results, report_file):
             --space-md: 16px;
             --space-lg: 24px;
             --space-xl: 32px;
-        }}
+        }
         
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Arial, sans-serif;
             line-height: 1.6;
             margin: 0;
             padding: var(--space-lg);
             background: var(--color-background);
             color: var(--color-text);
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background: var(--color-white);
             padding: var(--space-xl);
             border-radius: var(--space-sm);
             box-shadow: var(--shadow-md);
-        }}
+        }
         
-        h1 {{
+        h1 {
             font-size: 24px;
             font-weight: 600;
             text-align: center;
@@ -297,72 +260,72 @@ def generate_html_report(results, report_file):
             padding-bottom: var(--space-md);
             border-bottom: 2px solid var(--color-border);
             color: var(--color-text);
-        }}
+        }
         
-        h2 {{
+        h2 {
             font-size: 20px;
             font-weight: 600;
             margin: var(--space-xl) 0 var(--space-lg) 0;
             padding-bottom: var(--space-sm);
             border-bottom: 1px solid var(--color-border);
             color: var(--color-text);
-        }}
+        }
         
-        .summary {{
+        .summary {
             display: grid;
             grid-template-columns: repeat(3, 1fr);
             gap: var(--space-lg);
             margin: var(--space-xl) 0;
-        }}
+        }
         
-        .summary-item {{
+        .summary-item {
             padding: var(--space-lg);
             border-radius: var(--space-sm);
             text-align: center;
-        }}
+        }
         
-        .summary-label {{
+        .summary-label {
             font-size: 16px;
             font-weight: 500;
-        }}
+        }
         
-        .summary-count {{
+        .summary-count {
             font-size: 32px;
             font-weight: 600;
             margin: var(--space-sm) 0;
-        }}
+        }
         
-        .passes {{ 
+        .passes { 
             background: #e8f5e9;
             color: #1b5e20;
-        }}
+        }
         
-        .incomplete {{ 
+        .incomplete { 
             background: #fff3e0;
             color: #e65100;
-        }}
+        }
         
-        .violations {{ 
+        .violations { 
             background: #ffebee;
             color: #b71c1c;
-        }}
+        }
         
-        .issue {{
+        .issue {
             margin: var(--space-lg) 0;
             padding: var(--space-lg);
             border-radius: var(--space-sm);
             background: var(--color-white);
             border: 1px solid var(--color-border);
-        }}
+        }
         
-        .issue-header {{
+        .issue-header {
             display: flex;
             align-items: flex-start;
             gap: var(--space-sm);
             margin-bottom: var(--space-md);
-        }}
+        }
         
-        .impact {{
+        .impact {
             display: inline-block;
             padding: var(--space-xs) var(--space-sm);
             border-radius: var(--space-xs);
@@ -371,41 +334,41 @@ def generate_html_report(results, report_file):
             min-width: 80px;
             text-align: center;
             color: var(--color-white);
-        }}
+        }
         
-        .impact-critical {{ background: var(--color-critical); }}
-        .impact-serious {{ background: var(--color-serious); }}
-        .impact-moderate {{ background: var(--color-moderate); color: #000; }}
-        .impact-minor {{ background: var(--color-minor); }}
+        .impact-critical { background: var(--color-critical); }
+        .impact-serious { background: var(--color-serious); }
+        .impact-moderate { background: var(--color-moderate); color: #000; }
+        .impact-minor { background: var(--color-minor); }
         
-        .issue-title {{
+        .issue-title {
             font-size: 16px;
             font-weight: 500;
             color: var(--color-text);
             flex: 1;
-        }}
+        }
         
-        .help-link {{
+        .help-link {
             display: inline-block;
             margin-bottom: var(--space-lg);
             color: var(--color-link);
             text-decoration: none;
             font-size: 14px;
-        }}
+        }
         
-        .help-link:hover {{
+        .help-link:hover {
             text-decoration: underline;
-        }}
+        }
         
-        .element {{
+        .element {
             margin: var(--space-md) 0;
             padding: var(--space-md);
             background: #f8f9fa;
             border-radius: var(--space-xs);
             border: 1px solid var(--color-border);
-        }}
+        }
         
-        .element-html {{
+        .element-html {
             font-family: Monaco, monospace;
             font-size: 13px;
             padding: var(--space-sm);
@@ -414,184 +377,462 @@ def generate_html_report(results, report_file):
             border: 1px solid var(--color-border);
             overflow-x: auto;
             margin: var(--space-sm) 0;
-        }}
+        }
         
-        .element-summary {{
+        .element-summary {
             margin-top: var(--space-sm);
             color: #666;
             font-size: 14px;
-        }}
+        }
         
-        @media (max-width: 768px) {{
-            .summary {{
+        @media (max-width: 768px) {
+            .summary {
                 grid-template-columns: 1fr;
-            }}
+            }
             
-            .container {{
+            .container {
                 padding: var(--space-lg);
-            }}
+            }
             
-            .issue {{
+            .issue {
                 padding: var(--space-md);
-            }}
-        }}
-    </style>
-</head>
+            }
+        }
+"""
+
+# Reports link to a shared stylesheet in the reports directory unless
+# AXE_INLINE_CSS=1 asks for standalone files
+CSS_FILENAME = 'axe.css'
+_HTML_STYLE = '    <style>\n' + _REPORT_CSS + '    </style>\n'
+_HTML_CSS_LINK = f'    <link rel="stylesheet" href="{CSS_FILENAME}">\n'
+
+_HTML_BODY = """</head>
 <body>
     <div class="container">
         <h1>Accessibility Audit Report</h1>
         
-        <div class="summary">
+"""
+
+# Everything before the summary, pre-joined for each stylesheet mode, and the
+# standalone stylesheet's contents
+_REPORT_HEAD_INLINE = _HTML_HEAD + _HTML_STYLE + _HTML_BODY
+_REPORT_HEAD_LINKED = _HTML_HEAD + _HTML_CSS_LINK + _HTML_BODY
+_REPORT_CSS_FILE = textwrap.dedent(_REPORT_CSS)
+
+_SUMMARY_TEMPLATE = """        <div class="summary">
             <div class="summary-item violations">
                 <div class="summary-label">Violations</div>
-                <div class="summary-count">{len(violations)}</div>
+                <div class="summary-count">%(violations)d</div>
             </div>
             <div class="summary-item incomplete">
                 <div class="summary-label">Needs Review</div>
-                <div class="summary-count">{len(incomplete)}</div>
+                <div class="summary-count">%(incomplete)d</div>
             </div>
             <div class="summary-item passes">
                 <div class="summary-label">Passed</div>
-                <div class="summary-count">{len(passes)}</div>
+                <div class="summary-count">%(passes)d</div>
             </div>
         </div>
 """
-    
-    if violations:
-        report_html += """
-        <h2>Violations</h2>
-"""
-        for violation in violations:
-            impact = violation.get('impact', 'unknown')
-            report_html += f"""
-            <div class="issue">
-                <div class="issue-header">
-                    <span class="impact impact-{impact}">{impact.title()}</span>
-                    <div class="issue-title">{html.escape(violation.get('help', violation.get('description', 'No description')))}</div>
-                </div>
-                <a href="{violation.get('helpUrl', '#')}" class="help-link" target="_blank">Learn more about this issue</a>
-"""
-            for node in violation.get('nodes', []):
-                report_html += f"""
-                <div class="element">
-                    <div class="element-html">{html.escape(node.get('html', 'No HTML available'))}</div>
-                    <div class="element-summary">{html.escape(node.get('failureSummary', ''))}</div>
-                </div>
-"""
-            report_html += """
-            </div>
-"""
-    
-    if incomplete:
-        report_html += """
-        <h2>Needs Review</h2>
+
+_SECTION_TEMPLATE = """
+        <h2>%s</h2>
 """
-        for item in incomplete:
-            impact = item.get('impact', 'unknown')
-            report_html += f"""
+
+_ISSUE_TEMPLATE = """
             <div class="issue">
                 <div class="issue-header">
-                    <span class="impact impact-{impact}">{impact.title()}</span>
-                    <div class="issue-title">{html.escape(item.get('help', item.get('description', 'No description')))}</div>
+                    <span class="impact impact-%(impact)s">%(impact_title)s</span>
+                    <div class="issue-title">%(title)s</div>
                 </div>
-                <a href="{item.get('helpUrl', '#')}" class="help-link" target="_blank">Learn more about this issue</a>
+                <a href="%(help_url)s" class="help-link" target="_blank">Learn more about this issue</a>
 """
-            for node in item.get('nodes', []):
-                report_html += f"""
+
+_NODE_TEMPLATE = """
                 <div class="element">
-                    <div class="element-html">{html.escape(node.get('html', 'No HTML available'))}</div>
-                    <div class="element-summary">{html.escape(node.get('failureSummary', ''))}</div>
+                    <div class="element-html">%(html)s</div>
+                    <div class="element-summary">%(summary)s</div>
                 </div>
 """
-            report_html += """
+
+_ISSUE_END = """
             </div>
 """
-    
-    report_html += """
+
+_HTML_TAIL = """
         </div>
     </div>
 </body>
 </html>
 """
+
+# Same replacements as html.escape, applied in a single pass
+_HTML_ESCAPE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+})
+
+def _esc(text):
+    """Escape text for safe inclusion in HTML content and attributes."""
+    return text.translate(_HTML_ESCAPE) if text else ''
+
+def _render_issues(title, items, write):
+    """Write the HTML for a section of violations or incomplete items."""
+    # Local names skip the global lookups in the per-node loop
+    esc = _esc
+    node_template = _NODE_TEMPLATE
+    
+    write(_SECTION_TEMPLATE % title)
+    for item in items:
+        get = item.get
+        impact = esc(get('impact') or 'unknown')
+        write(_ISSUE_TEMPLATE % {
+            'impact': impact,
+            'impact_title': impact.title(),
+            'title': esc(get('help') or get('description') or 'No description'),
+            'help_url': esc(get('helpUrl') or '#'),
+        })
+        for node in get('nodes', ()):
+            write(node_template % {
+                'html': esc(node.get('html') or 'No HTML available'),
+                'summary': esc(node.get('failureSummary')),
+            })
+        write(_ISSUE_END)
+
+def generate_html_report(results, report_file):
+    """Generate an HTML report from parsed axe-core results.
+    
+    Each fragment is written to the file as it's rendered, so the report is
+    never held in memory as a whole.
+    """
+    violations = results['violations']
+    incomplete = results['incomplete']
+    
+    # Write to a temporary file and swap it in, so an interrupted run never
+    # leaves a half-written report behind
+    tmp_file = f'{report_file}.tmp.{os.getpid()}'
+    try:
+        with open(tmp_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            write = f.write
+            inline_css = os.getenv('AXE_INLINE_CSS') == '1'
+            write(_REPORT_HEAD_INLINE if inline_css else _REPORT_HEAD_LINKED)
+            write(_SUMMARY_TEMPLATE % {
+                'violations': len(violations),
+                'incomplete': len(incomplete),
+                'passes': results['passes'],
+            })
+            
+            if violations:
+                _render_issues('Violations', violations, write)
+            
+            if incomplete:
+                _render_issues('Needs Review', incomplete, write)
+            
+            write(_HTML_TAIL)
+        os.replace(tmp_file, report_file)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_file)
+        raise
+
+# Fields of each violation/incomplete entry that the reports actually use
+_ISSUE_FIELDS = ('impact', 'help', 'description', 'helpUrl', 'tags')
+_NODE_FIELDS = ('html', 'failureSummary')
+
+# ijson prefixes for the issue lists, whether axe emits a list or a single object
+_ISSUE_PREFIXES = {
+    'item.violations.item': 'violations',
+    'item.incomplete.item': 'incomplete',
+    'violations.item': 'violations',
+    'incomplete.item': 'incomplete',
+}
+_PASS_PREFIXES = ('item.passes.item', 'passes.item')
+_PAGE_PREFIXES = ('item', '')
+
+AXE_TIMEOUT = 30  # seconds
+
+def _trim_issue(issue):
+    """Keep only the fields of an axe-core issue that the reports render."""
+    trimmed = {field: issue[field] for field in _ISSUE_FIELDS if field in issue}
+    trimmed['nodes'] = [
+        {field: node[field] for field in _NODE_FIELDS if field in node}
+        for node in issue.get('nodes', [])
+    ]
+    return trimmed
+
+def _empty_results():
+    return {'violations': [], 'incomplete': [], 'passes': 0}
+
+def _pages_from_data(data):
+    """Yield trimmed results for each page in already-decoded axe-core output."""
+    for page in (data if isinstance(data, list) else [data]):
+        results = _empty_results()
+        results['violations'] = [_trim_issue(i) for i in page.get('violations', [])]
+        results['incomplete'] = [_trim_issue(i) for i in page.get('incomplete', [])]
+        results['passes'] = len(page.get('passes', []))
+        yield results
+
+def iter_axe_results(stream):
+    """Parse axe-core JSON output from a binary stream, yielding one result per page.
+    
+    Only the fields used by the reports are kept, and passes are counted
+    rather than stored, so peak memory stays close to the size of the
+    violations rather than the whole document. Each result is a dict with
+    'violations' and 'incomplete' lists and a 'passes' count.
+    
+    Results are collected rather than rendered as they arrive: the report
+    opens with the summary counts, and the terminal table and cache need the
+    same trimmed results anyway.
+    """
+    if not HAS_IJSON:
+        yield from _pages_from_data(json_loads(stream.read()))
+        return
+    
+    results = builder = section = item_prefix = None
+    for prefix, event, value in ijson.parse(stream):
+        if builder is not None:
+            builder.event(event, value)
+            if event == 'end_map' and prefix == item_prefix:
+                results[section].append(_trim_issue(builder.value))
+                builder = None
+        elif event == 'start_map':
+            if prefix in _PAGE_PREFIXES:
+                results = _empty_results()
+            elif prefix in _ISSUE_PREFIXES:
+                section, item_prefix = _ISSUE_PREFIXES[prefix], prefix
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            elif prefix in _PASS_PREFIXES:
+                results['passes'] += 1
+        elif event == 'end_map' and prefix in _PAGE_PREFIXES:
+            yield results
+
+def parse_axe_results(stream):
+    """Parse axe-core JSON output for a single page (see iter_axe_results)."""
+    return next(iter_axe_results(stream), None) or _empty_results()
+
+def stream_axe_results(cmd, log, log_file):
+    """Run axe-core and parse its JSON output as it is produced.
+    
+    axe's stderr is written straight to the log file by the OS rather than
+    passing through Python. Returns the parsed results, or None if axe failed
+    (after logging and reporting the error). Raises subprocess.TimeoutExpired
+    if axe hangs.
+    """
+    # Log lines are buffered by the file object; this flush is the only write
+    # before axe starts appending its stderr to the same file
+    log.write("STDERR:\n")
+    log.flush()
+    stderr_start = log.tell()
+    
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=log)
+    
+    # Kill axe if it hangs, which ends the stream for the parser
+    timed_out = threading.Event()
+    
+    def kill():
+        timed_out.set()
+        proc.kill()
+    timer = threading.Timer(AXE_TIMEOUT, kill)
+    timer.start()
+    
+    results = parse_error = None
+    try:
+        results = parse_axe_results(proc.stdout)
+    except JSON_ERRORS as e:
+        parse_error = e
+    finally:
+        proc.stdout.close()
+        returncode = proc.wait()
+        timer.cancel()
+    log.write("\n")
+    
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, AXE_TIMEOUT)
+    
+    if returncode != 0:
+        # Only read stderr back from the log when it's needed for the error
+        log.flush()
+        with open(log_file, 'rb') as f:
+            f.seek(stderr_start)
+            stderr = f.read().decode('utf-8', errors='replace').strip()
+        error_msg = f"axe-core CLI failed with return code {returncode}.\n"
+        if stderr:
+            error_msg += f"Error: {stderr}\n"
+        log.write(f"ERROR: {error_msg}")
+        show_error_dialog(f"Error running axe-core audit:\n{error_msg}\nCheck the log file: {log_file}")
+        return None
+    
+    if parse_error is not None:
+        log.write(f"JSON Parse Error: {str(parse_error)}\n")
+        show_error_dialog(
+            f"Failed to parse axe-core results.\n"
+            f"JSON Error: {str(parse_error)}\n"
+            f"Check the log file: {log_file}"
+        )
+        return None
+    
+    return results
+
+def get_cache():
+    """Get the results cache, honouring AXE_CACHE_DIR."""
+    from src.tools.accessibility.axe._cache import DEFAULT_CACHE_DIR, FileCache
+    return FileCache(os.getenv('AXE_CACHE_DIR', DEFAULT_CACHE_DIR))
+
+def lookup_cache(url, fingerprint=None):
+    """Look up cached results for a URL.
+    
+    Returns (cache, key, cached) where key is None if the page couldn't be
+    fingerprinted and cached is None on a cache miss.
+    """
+    from src.tools.accessibility.axe._cache import cache_key, fingerprint_url
     
-    with open(report_file, 'w') as f:
-        f.write(report_html)
+    cache = get_cache()
+    fingerprint = fingerprint or fingerprint_url(url)
+    if not fingerprint:
+        return cache, None, None
+    key = cache_key(url, fingerprint)
+    return cache, key, cache.get(key)
 
-def run_axe_audit(url, reports_dir, logs_dir):
-    """Run the axe-core audit on the specified URL."""
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    domain = url.split('/')[2] if '://' in url else url.split('/')[0]
+def store_cache(cache, key, results):
+    """Cache results for key; a failed write only costs the next run a rescan."""
+    try:
+        cache.set(key, json_dumps(results))
+    except OSError as e:
+        _console().print(f"[yellow]Warning: couldn't write the results cache: {e}[/yellow]")
+
+REPORT_INDEX_FILENAME = '.axe-etags.json'
+
+def load_report_index(reports_dir):
+    """Load the URL -> {validator, digest, report} index of previous reports."""
+    try:
+        with open(reports_dir / REPORT_INDEX_FILENAME, 'rb') as f:
+            return json_loads(f.read())
+    except (OSError, *JSON_ERRORS):
+        return {}
+
+def save_report_index(reports_dir, index):
+    """Write the report index atomically."""
+    path = reports_dir / REPORT_INDEX_FILENAME
+    tmp = path.with_name(f'{path.name}.tmp.{os.getpid()}')
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(json_dumps(index))
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp)
+        raise
+
+def previous_report(reports_dir, url, validator):
+    """Get the last report for url if the page's validator hasn't changed."""
+    if not validator:
+        return None
+    entry = load_report_index(reports_dir).get(url)
+    if not entry or entry.get('validator') != validator:
+        return None
+    report = entry.get('report')
+    return report if report and os.path.exists(report) else None
+
+def results_digest(results):
+    """Hash the audit results together with the report CSS mode."""
+    inline_css = b'1' if os.getenv('AXE_INLINE_CSS') == '1' else b'0'
+    return hashlib.blake2b(json_dumps(results) + inline_css, digest_size=8).hexdigest()
+
+def identical_report(index, url, digest):
+    """Get the last report for url if it was rendered from identical results."""
+    entry = index.get(url)
+    if not entry or entry.get('digest') != digest:
+        return None
+    report = entry.get('report')
+    return Path(report) if report and os.path.exists(report) else None
+
+# Command that opens a file with its default handler; Windows uses
+# os.startfile instead
+_OPEN_CMD = {'Darwin': 'open', 'Windows': None}.get(platform.system(), 'xdg-open')
+
+def open_report(report_file):
+    """Open a report with the platform's default handler."""
+    _console().print(f"\nOpening HTML report: {report_file}")
+    if _OPEN_CMD:
+        subprocess.run([_OPEN_CMD, report_file])
+    else:
+        os.startfile(report_file)
+
+def run_axe_audit(url, reports_dir, logs_dir, use_cache=False, timestamp=None):
+    """Run the axe-core audit on the specified URL.
+    
+    timestamp names the log and report files; callers running several audits
+    can compute it once and pass it in.
+    """
+    timestamp = timestamp or datetime.now().strftime(_TS_FMT)
+    domain = url_domain(url)
     
     # Simplified command - just get the core results
     cmd = ['axe', url, '--stdout']
     
+    # Skip the audit entirely if the page is byte-identical to the last scan,
+    # otherwise reuse cached results if they match the page's fingerprint
+    cache = key = cached = validator = None
+    if use_cache:
+        from src.tools.accessibility.axe._cache import body_fingerprint, page_validator
+        validator = page_validator(url)
+        report_file = previous_report(reports_dir, url, validator)
+        if report_file:
+            _console().print(f"[dim]Page unchanged since the last audit ({validator})[/dim]")
+            open_report(report_file)
+            return True
+        # The HEAD request has already been made, so without a validator go
+        # straight to hashing the body rather than asking for one again
+        cache, key, cached = lookup_cache(url, validator or body_fingerprint(url))
+    
     # Set up logging
-    log_file = os.path.join(logs_dir, f'axe_audit_{timestamp}.log')
+    log_file = logs_dir / f'axe_audit_{timestamp}.log'
     with open(log_file, 'w') as log:
         log.write(f'Running axe-core audit on: {url}\n')
-        log.write(f'Command: {" ".join(cmd)}\n\n')
         
         try:
-            # Add timeout to prevent hanging
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30  # 30 second timeout
-            )
+            if cached is not None:
+                log.write(f'Using cached results (key: {key})\n\n')
+                results = json_loads(cached)
+            else:
+                log.write(f'Command: {" ".join(cmd)}\n\n')
+                results = stream_axe_results(cmd, log, log_file)
+                if results is None:
+                    return False
+                if key:
+                    store_cache(cache, key, results)
             
-            # Log both stdout and stderr
-            if result.stdout:
-                log.write("STDOUT:\n")
-                log.write(result.stdout)
-                log.write("\n")
+            # Reuse the last report if the results haven't changed, rather
+            # than rendering another identical file
+            index = load_report_index(reports_dir)
+            digest = results_digest(results)
+            report_file = identical_report(index, url, digest)
+            if report_file:
+                log.write(f'Results unchanged, reusing {report_file}\n')
+            else:
+                report_file = reports_dir / f'axe_{domain}_{timestamp}.html'
+                generate_html_report(results, report_file)
             
-            if result.stderr:
-                log.write("STDERR:\n")
-                log.write(result.stderr)
-                log.write("\n")
+            index[url] = {'validator': validator, 'digest': digest, 'report': str(report_file)}
+            try:
+                save_report_index(reports_dir, index)
+            except OSError as e:
+                log.write(f'WARNING: could not save the report index: {e}\n')
             
-            if result.returncode != 0:
-                error_msg = f"axe-core CLI failed with return code {result.returncode}.\n"
-                if result.stderr:
-                    error_msg += f"Error: {result.stderr}\n"
-                log.write(f"ERROR: {error_msg}")
-                show_error_dialog(f"Error running axe-core audit:\n{error_msg}\nCheck the log file: {log_file}")
-                return False
+            # Display results in terminal
+            display_terminal_results(results)
             
-            try:
-                results = json.loads(result.stdout)
-                
-                # Always generate HTML report
-                report_file = os.path.join(reports_dir, f'axe_{domain}_{timestamp}.html')
-                generate_html_report(results, report_file)
-                
-                # Display results in terminal
-                display_terminal_results(results)
-                
-                # Open HTML report in browser
-                console.print(f"\nOpening HTML report: {report_file}")
-                if platform.system() == 'Darwin':
-                    subprocess.run(['open', report_file])
-                elif platform.system() == 'Windows':
-                    os.startfile(report_file)
-                else:
-                    subprocess.run(['xdg-open', report_file])
-                
-                return True
-                
-            except json.JSONDecodeError as e:
-                log.write(f"JSON Parse Error: {str(e)}\n")
-                log.write(f"Raw output:\n{result.stdout}\n")
-                show_error_dialog(
-                    f"Failed to parse axe-core results.\n"
-                    f"JSON Error: {str(e)}\n"
-                    f"Check the log file: {log_file}"
-                )
-                return False
+            # Open HTML report in browser
+            open_report(report_file)
+            
+            return True
             
         except subprocess.TimeoutExpired:
-            error_msg = "axe-core audit timed out after 30 seconds"
+            error_msg = f"axe-core audit timed out after {AXE_TIMEOUT} seconds"
             log.write(f"ERROR: {error_msg}\n")
             show_error_dialog(f"{error_msg}\nCheck the log file: {log_file}")
             return False
@@ -602,91 +843,487 @@ def run_axe_audit(url, reports_dir, logs_dir):
             show_error_dialog(f"{error_msg}\nCheck the log file: {log_file}")
             return False
 
-def display_terminal_results(results):
-    """Display axe-core results in a formatted terminal output."""
-    if isinstance(results, list):
-        results = results[0]  # axe-core returns a list with one result object
+async def _audit_group(group, sem, logs_dir, timestamp):
+    """Audit a group of (index, url) pairs with a single axe process.
     
-    violations = results.get('violations', [])
-    incomplete = results.get('incomplete', [])
-    passes = results.get('passes', [])
+    axe-core reuses one browser session for every URL it's given, so larger
+    groups pay for fewer browser launches. Returns the parsed results for
+    each URL in the group, or None for URLs whose audit failed.
+    """
+    import asyncio
+    
+    urls = [url for _, url in group]
+    failed = [None] * len(group)
+    cmd = ['axe', *urls, '--stdout']
+    timeout = AXE_TIMEOUT * len(urls)
+    
+    # Batch runs share a timestamp, so the suffix keeps filenames unique
+    log_file = logs_dir / f'axe_audit_{timestamp}_{file_suffix()}.log'
+    with open(log_file, 'w') as log:
+        log.write(f'Running axe-core audit on: {", ".join(urls)}\n')
+        log.write(f'Command: {" ".join(cmd)}\n\n')
+        
+        # Flush the buffered header before axe appends its stderr
+        log.write("STDERR:\n")
+        log.flush()
+        
+        async with sem:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=log
+            )
+            try:
+                stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                log.write(f"ERROR: axe-core audit timed out after {timeout} seconds\n")
+                for url in urls:
+                    _console().print(f"[red]Timed out:[/red] {url}")
+                return failed
+        
+        log.write("\n")
+        
+        if proc.returncode != 0:
+            log.write(f"ERROR: axe-core CLI failed with return code {proc.returncode}.\n")
+            for url in urls:
+                _console().print(f"[red]Failed:[/red] {url} (see {log_file})")
+            return failed
+        
+        try:
+            # The output is already in memory, so a one-shot parse beats streaming
+            pages = list(_pages_from_data(json_loads(stdout)))
+        except JSON_ERRORS as e:
+            log.write(f"JSON Parse Error: {str(e)}\n")
+            for url in urls:
+                _console().print(f"[red]Unreadable results:[/red] {url} (see {log_file})")
+            return failed
+        
+        # Results come back in the order the URLs were given
+        if len(pages) != len(urls):
+            log.write(f"ERROR: expected {len(urls)} results, got {len(pages)}\n")
+            for url in urls:
+                _console().print(f"[red]Incomplete results:[/red] {url} (see {log_file})")
+            return failed
+    
+    return pages
+
+def find_axe_core_js():
+    """Locate axe-core's browser bundle for in-process audits.
+    
+    Uses AXE_CORE_JS if set, otherwise the copy of axe-core installed with
+    the axe CLI. Returns None if it can't be found.
+    """
+    path = os.getenv('AXE_CORE_JS')
+    if path:
+        return Path(path) if Path(path).is_file() else None
+    
+    axe_path = shutil.which('axe')
+    if axe_path is None:
+        return None
+    # npm links the CLI into bin/; axe-core sits in a node_modules above its real path
+    for parent in Path(os.path.realpath(axe_path)).parents:
+        candidate = parent / 'node_modules' / 'axe-core' / 'axe.min.js'
+        if candidate.is_file():
+            return candidate
+    return None
+
+async def _audit_with_playwright(pending, concurrency, axe_js, logs_dir, timestamp):
+    """Audit (index, url) pairs in one in-process Playwright browser.
+    
+    The browser is launched once and each page gets axe-core injected
+    directly, so there is no Node.js or Chromium start-up per URL. Returns
+    the parsed results for each URL, or None for URLs whose audit failed
+    (with the error written to a log file in logs_dir). Returns None
+    instead of a list if the browser can't be launched.
+    """
+    import asyncio
+    from playwright.async_api import async_playwright
+    
+    axe_source = axe_js.read_text(encoding='utf-8')
+    sem = asyncio.Semaphore(concurrency)
+    
+    async def audit(browser, url):
+        page = None
+        async with sem:
+            try:
+                page = await browser.new_page()
+                await page.goto(url, timeout=AXE_TIMEOUT * 1000)
+                # evaluate() isn't subject to the page's Content-Security-Policy
+                await page.evaluate(axe_source)
+                data = await asyncio.wait_for(page.evaluate('axe.run()'), AXE_TIMEOUT)
+                return next(_pages_from_data(data))
+            except Exception as e:  # Playwright raises its own error types for page failures
+                # Batch runs share a timestamp, so the suffix keeps filenames unique
+                log_file = logs_dir / f'axe_audit_{timestamp}_{file_suffix()}.log'
+                with open(log_file, 'w') as log:
+                    log.write(f'Running axe-core audit on: {url}\n')
+                    log.write('Browser: Playwright Chromium\n\n')
+                    log.write(f'ERROR: {type(e).__name__}: {e}\n')
+                _console().print(f"[red]Failed:[/red] {url} (see {log_file})")
+                return None
+            finally:
+                if page is not None:
+                    # A page that can't be closed mustn't fail the other audits
+                    with contextlib.suppress(Exception):
+                        await page.close()
+    
+    async with async_playwright() as playwright:
+        try:
+            browser = await playwright.chromium.launch()
+        except Exception as e:  # e.g. Playwright's browsers aren't installed
+            # Playwright's errors run to several lines; the first says what went wrong
+            reason = (str(e).strip().splitlines() or [type(e).__name__])[0]
+            _console().print(
+                f"[dim]Couldn't launch Playwright's browser, using the axe CLI ({reason})[/dim]"
+            )
+            return None
+        try:
+            return await asyncio.gather(*(audit(browser, url) for _, url in pending))
+        finally:
+            await browser.close()
+
+async def run_axe_audit_many(urls, reports_dir, logs_dir, concurrency=None, use_cache=False,
+                             shared_browser=False, timestamp=None, use_playwright=False):
+    """Audit several URLs concurrently, running at most `concurrency` axe processes at once.
+    
+    With shared_browser, the URLs are split across `concurrency` axe
+    processes so each launches its browser once, rather than once per URL.
+    With use_playwright, every URL is audited in a single in-process browser
+    instead, falling back to the axe CLI if Playwright or axe-core is missing.
+    Returns the report path for each URL, or None where the audit failed.
+    """
+    import asyncio
+    
+    concurrency = concurrency or os.cpu_count() or 1
+    timestamp = timestamp or datetime.now().strftime(_TS_FMT)
+    results = [None] * len(urls)
+    cache_entries = [(None, None)] * len(urls)
+    
+    # Serve unchanged pages from the cache and only audit the rest
+    pending = list(enumerate(urls))
+    if use_cache:
+        loop = asyncio.get_running_loop()
+        lookups = await asyncio.gather(*(
+            loop.run_in_executor(None, lookup_cache, url) for url in urls
+        ))
+        pending = []
+        for index, (cache, key, cached) in enumerate(lookups):
+            if cached is not None:
+                results[index] = json_loads(cached)
+            else:
+                cache_entries[index] = (cache, key)
+                pending.append((index, urls[index]))
+    
+    axe_js = None
+    if use_playwright and pending:
+        axe_js = find_axe_core_js()
+        try:
+            import playwright.async_api  # noqa: F401
+        except ImportError:
+            axe_js = None
+        if axe_js is None:
+            _console().print("[dim]Playwright or axe-core not found, using the axe CLI[/dim]")
+    
+    group_results = None
+    if axe_js is not None:
+        pages = await _audit_with_playwright(pending, concurrency, axe_js, logs_dir, timestamp)
+        if pages is not None:
+            groups = [pending]
+            group_results = [pages]
+    if group_results is None:
+        if shared_browser:
+            groups = [
+                pending[i::concurrency] for i in range(concurrency) if pending[i::concurrency]
+            ]
+        else:
+            groups = [[item] for item in pending]
+        
+        sem = asyncio.Semaphore(concurrency)
+        group_results = await asyncio.gather(*(
+            _audit_group(group, sem, logs_dir, timestamp) for group in groups
+        ))
+    for group, pages in zip(groups, group_results):
+        for (index, _), page in zip(group, pages):
+            results[index] = page
+            cache, key = cache_entries[index]
+            if page is not None and key:
+                store_cache(cache, key, page)
+    
+    reports = []
+    for url, page in zip(urls, results):
+        if page is None:
+            reports.append(None)
+            continue
+        report_file = reports_dir / f'axe_{url_domain(url)}_{timestamp}_{file_suffix()}.html'
+        generate_html_report(page, report_file)
+        _console().print(
+            f"{url}: ❌ {len(page['violations'])} violations, "
+            f"⚠️  {len(page['incomplete'])} to review\n  [dim]{report_file}[/dim]"
+        )
+        reports.append(report_file)
+    return reports
+
+def run_axe_terminal(urls):
+    """Run axe-core with its built-in reporter, printing straight to the terminal.
+    
+    Skips the JSON round-trip entirely, for when no HTML report is wanted.
+    """
+    timeout = AXE_TIMEOUT * len(urls)
+    try:
+        result = subprocess.run(['axe', *urls], timeout=timeout)
+    except subprocess.TimeoutExpired:
+        show_error_dialog(f"axe-core audit timed out after {timeout} seconds")
+        return False
+    return result.returncode == 0
+
+# How many levels of sitemap index are followed below the given sitemap
+SITEMAP_MAX_DEPTH = 2
+
+def _fetch_sitemap(sitemap_url):
+    """Fetch and parse one sitemap, returning its root element."""
+    import urllib.request
+    import xml.etree.ElementTree as ET
+    
+    with urllib.request.urlopen(sitemap_url, timeout=30) as response:
+        try:
+            return ET.parse(response).getroot()
+        except ET.ParseError as e:
+            raise ValueError(f"invalid sitemap XML: {e}") from e
+
+def _local_name(tag):
+    """Strip the XML namespace from an element tag."""
+    return tag.rsplit('}', 1)[-1]
+
+def urls_from_sitemap(sitemap_url):
+    """Get the page URLs listed in an XML sitemap.
+    
+    A sitemap index is followed into the sitemaps it lists, up to
+    SITEMAP_MAX_DEPTH levels down; a listed sitemap that can't be read is
+    skipped with a warning. Raises OSError if the given sitemap can't be
+    fetched and ValueError if it isn't valid XML.
+    """
+    urls = []
+    seen = set()
+    pending = [(sitemap_url, 0)]
+    while pending:
+        url, depth = pending.pop(0)
+        if url in seen:
+            continue
+        seen.add(url)
+        try:
+            root = _fetch_sitemap(url)
+        except (OSError, ValueError) as e:
+            if depth == 0:
+                raise
+            _console().print(f"[yellow]Skipping sitemap {url}: {e}[/yellow]")
+            continue
+        
+        # <url> entries are pages; <sitemap> entries are further sitemaps
+        for entry in root:
+            loc = next((child for child in entry if _local_name(child.tag) == 'loc'), None)
+            location = (loc.text or '').strip() if loc is not None else ''
+            if not location:
+                continue
+            kind = _local_name(entry.tag)
+            if kind == 'url':
+                urls.append(location)
+            elif kind == 'sitemap' and depth < SITEMAP_MAX_DEPTH:
+                pending.append((location, depth + 1))
+            elif kind == 'sitemap':
+                _console().print(f"[yellow]Skipping deeply nested sitemap {location}[/yellow]")
+    return urls
+
+# Past this many rows, rich's table layout (which measures every cell) is
+# slower than it's worth, so issues are listed as plain lines instead
+PLAIN_TABLE_ROWS = 100
+
+def _build_issue_table(title, items, impact_style):
+    """Build a rich table listing axe-core issues."""
+    from rich.table import Table
+    from rich.text import Text
+    
+    table = Table(title=title)
+    table.add_column("Impact", style=impact_style)
+    table.add_column("Description")
+    table.add_column("WCAG Criteria")
+    
+    for item in items:
+        get = item.get
+        # axe's text is shown as plain Text, so brackets in rule descriptions
+        # aren't parsed (or mangled) as rich markup
+        table.add_row(
+            get('impact') or 'unknown',
+            Text(get('help') or get('description') or 'No description'),
+            ", ".join(get('tags', ()))
+        )
+    
+    return table
+
+def _print_issue_lines(console, title, items):
+    """Print axe-core issues as plain aligned lines, without rich's table layout."""
+    lines = [title, '']
+    for item in items:
+        get = item.get
+        lines.append('%-10s %s  (%s)' % (
+            get('impact') or 'unknown',
+            get('help') or get('description') or 'No description',
+            ', '.join(get('tags', ()))
+        ))
+    console.out('\n'.join(lines), highlight=False)
+
+def _print_issues(console, title, items, impact_style):
+    """Print issues as a rich table, or as plain lines for very long lists."""
+    if len(items) > PLAIN_TABLE_ROWS:
+        _print_issue_lines(console, title, items)
+    else:
+        console.print(_build_issue_table(title, items, impact_style))
+
+def display_terminal_results(results):
+    """Display parsed axe-core results in a formatted terminal output."""
+    violations = results['violations']
+    incomplete = results['incomplete']
+    console = _console()
     
     # Show summary
     console.print("\n=== Axe Core Audit Results ===\n")
-    console.print(f"✅ Passed: {len(passes)} checks")
+    console.print(f"✅ Passed: {results['passes']} checks")
     console.print(f"⚠️  Needs review: {len(incomplete)} checks")
     console.print(f"❌ Violations: {len(violations)} checks\n")
     
-    if not violations and not incomplete:
+    if not (violations or incomplete):
+        from rich.panel import Panel
         console.print(Panel("✅ No accessibility violations found!", style="green"))
         return
     
     # Show violations
     if violations:
-        table = Table(title=f"Found {len(violations)} accessibility violations")
-        table.add_column("Impact", style="red")
-        table.add_column("Description")
-        table.add_column("WCAG Criteria")
-        
-        for violation in violations:
-            table.add_row(
-                violation.get('impact', 'unknown'),
-                violation.get('help', violation.get('description', 'No description')),
-                ", ".join(violation.get('tags', []))
-            )
-        
-        console.print(table)
+        _print_issues(
+            console, f"Found {len(violations)} accessibility violations", violations, "red"
+        )
         console.print()
     
     # Show items needing review
     if incomplete:
-        table = Table(title=f"Found {len(incomplete)} items needing review")
-        table.add_column("Impact", style="yellow")
-        table.add_column("Description")
-        table.add_column("WCAG Criteria")
-        
-        for item in incomplete:
-            table.add_row(
-                item.get('impact', 'unknown'),
-                item.get('help', item.get('description', 'No description')),
-                ", ".join(item.get('tags', []))
-            )
-        
-        console.print(table)
+        _print_issues(
+            console, f"Found {len(incomplete)} items needing review", incomplete, "yellow"
+        )
+
+OUTPUT_FORMATS = ('html', 'terminal')
+
+def parse_args(argv=None):
+    """Parse the command line, with defaults taken from the environment and .env."""
+    # Loaded first, as some option defaults come from the environment
+    from dotenv import load_dotenv
+    load_dotenv()
+    
+    parser = argparse.ArgumentParser(description='Run an axe-core accessibility audit.')
+    parser.add_argument(
+        'urls',
+        nargs='*',
+        metavar='url',
+        help='URL(s) to audit (defaults to active browser or clipboard)'
+    )
+    parser.add_argument('--sitemap', help='audit every page listed in this sitemap URL')
+    parser.add_argument(
+        '--urls-file',
+        help='also audit every URL listed in this file, one per line'
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=positive_int,
+        default=os.cpu_count(),
+        help='maximum number of audits to run at once when auditing several URLs'
+    )
+    parser.add_argument(
+        '--output',
+        choices=OUTPUT_FORMATS,
+        default=os.getenv('AXE_OUTPUT_FORMAT', 'html'),
+        help="'html' writes and opens a report; 'terminal' prints axe's own text report"
+    )
+    parser.add_argument(
+        '--no-cache', action='store_true', help='ignore cached results for this run'
+    )
+    parser.add_argument(
+        '--clear-cache', action='store_true', help='remove all cached results first'
+    )
+    args = parser.parse_args(argv)
+    # argparse doesn't check defaults against choices, so check the env's
+    if args.output not in OUTPUT_FORMATS:
+        parser.error(
+            f"AXE_OUTPUT_FORMAT must be one of {', '.join(OUTPUT_FORMATS)}, "
+            f"not {args.output!r}"
+        )
+    return args
 
 def main():
     """Main function to run the axe-core audit."""
-    # Load environment variables
-    load_dotenv()
+    args = parse_args()
+    
+    if args.clear_cache:
+        get_cache().clear()
     
     # Check if axe-core CLI is installed
     if not check_axe_cli():
         sys.exit(1)
     
-    # Set up output directories
+    # Set up output directories, and one timestamp for every file this run writes
     reports_dir, logs_dir = setup_output_directory()
+    timestamp = datetime.now().strftime(_TS_FMT)
+    
+    # Results caching is opt-in via AXE_CACHE=1
+    use_cache = os.getenv('AXE_CACHE') == '1' and not args.no_cache
+    
+    urls = list(args.urls)
+    if args.urls_file:
+        try:
+            urls.extend(urls_from_file(args.urls_file))
+        except OSError as e:
+            show_error_dialog(f"Couldn't read URLs file {args.urls_file}:\n{e}")
+            sys.exit(1)
+    if args.sitemap:
+        try:
+            urls.extend(urls_from_sitemap(args.sitemap))
+        except (OSError, ValueError) as e:
+            show_error_dialog(f"Couldn't read sitemap {args.sitemap}:\n{e}")
+            sys.exit(1)
+    
+    # Several URLs are audited concurrently, without per-URL terminal tables
+    if len(urls) > 1:
+        invalid = [u for u in urls if not _is_http_url(u)]
+        if invalid:
+            show_error_dialog("Invalid URL(s):\n" + "\n".join(invalid))
+            sys.exit(1)
+        if args.output == 'terminal':
+            sys.exit(0 if run_axe_terminal(urls) else 1)
+        import asyncio
+        reports = asyncio.run(run_axe_audit_many(
+            urls,
+            reports_dir,
+            logs_dir,
+            concurrency=args.concurrency,
+            use_cache=use_cache,
+            shared_browser=os.getenv('AXE_SHARED_BROWSER') == '1',
+            timestamp=timestamp,
+            use_playwright=os.getenv('AXE_PLAYWRIGHT') == '1'
+        ))
+        _console().print(f"\n{sum(1 for r in reports if r)} of {len(urls)} audits completed")
+        sys.exit(0 if all(reports) else 1)
     
     # Get URL from command line, active window, or clipboard
     url = None
     
-    if len(sys.argv) > 1:
-        url = sys.argv[1]
+    if urls:
+        url = urls[0]
     else:
-        # Try browser first
-        try:
-            url = get_active_browser_url()
-            if url:
-                console.print(f"[dim]Found URL in active browser: {url}[/dim]")
-        except Exception as e:
-            console.print(f"[dim]Error getting browser URL: {e}[/dim]")
-        
-        # Then try clipboard if browser failed
-        if not url:
-            url = get_url_from_clipboard()
-            if url:
-                console.print(f"[dim]Found URL in clipboard: {url}[/dim]")
+        # The browser's URL takes precedence over the clipboard's
+        url, source = race_active_url(get_url_from_clipboard, _browser_url_or_none)
+        if url:
+            where = 'active browser' if source == 'browser' else 'clipboard'
+            _console().print(f"[dim]Found URL in {where}: {url}[/dim]")
     
-    if not url or not url.startswith(('http://', 'https://')):
+    if not url or not _is_http_url(url):
         show_error_dialog(
             "No valid URL found!\n\n"
             "Please either:\n"
@@ -697,7 +1334,9 @@ def main():
         sys.exit(1)
     
     # Run the audit
-    success = run_axe_audit(url, reports_dir, logs_dir)
+    if args.output == 'terminal':
+        sys.exit(0 if run_axe_terminal([url]) else 1)
+    success = run_axe_audit(url, reports_dir, logs_dir, use_cache=use_cache, timestamp=timestamp)
     sys.exit(0 if success else 1)
 
 if __name__ == '__main__':
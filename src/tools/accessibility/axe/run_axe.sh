@@ -36,7 +36,7 @@ setup_venv() {
     python3 -m venv "${VENV_PATH}"
     # shellcheck source=/dev/null
     . "${VENV_PATH}/bin/activate"
-    "${VENV_PATH}/bin/pip" install --quiet pyperclip rich python-dotenv psutil
+    "${VENV_PATH}/bin/pip" install --quiet pyperclip rich python-dotenv psutil ijson
     # Install Windows-specific packages if on Windows
     if [[ "$OSTYPE" == "msys" || "$OSTYPE" == "win32" ]]; then
         "${VENV_PATH}/bin/pip" install --quiet pywin32
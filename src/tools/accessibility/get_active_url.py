@@ -0,0 +1,232 @@
+"""
+Get URL from active browser window across different platforms.
+Supports Chrome, Safari, Firefox on macOS, Windows, and Linux.
+"""
+
+import hashlib
+import os
+import re
+import sys
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+# Compiled AppleScripts are cached here so osascript doesn't recompile them per call
+APPLESCRIPT_CACHE_DIR = Path.home() / '.cache' / 'streamlined-dev-tools' / 'applescript'
+OSASCRIPT_TIMEOUT = 2  # seconds
+
+def _compiled_applescript(source: str) -> Optional[Path]:
+    """Compile an AppleScript once and return the path of the compiled script.
+    
+    Scripts are cached by a hash of their source. Returns None if the script
+    can't be compiled, in which case callers should run the source directly.
+    """
+    digest = hashlib.sha256(source.encode('utf-8')).hexdigest()[:16]
+    compiled = APPLESCRIPT_CACHE_DIR / f'{digest}.scpt'
+    if compiled.exists():
+        return compiled
+    
+    try:
+        APPLESCRIPT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Compile to a temporary name so a concurrent run never sees a partial file
+        tmp = compiled.with_name(f'{digest}.{os.getpid()}.scpt')
+        result = subprocess.run(
+            ['osacompile', '-e', source, '-o', str(tmp)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=10
+        )
+        if result.returncode != 0:
+            return None
+        os.replace(tmp, compiled)
+        return compiled
+    except (subprocess.SubprocessError, OSError):
+        return None
+
+def _run_applescript(script: str) -> Optional[str]:
+    """Run an AppleScript and return its output, or None if it printed nothing."""
+    compiled = _compiled_applescript(script)
+    cmd = ['osascript', str(compiled)] if compiled else ['osascript', '-e', script]
+    try:
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,  # Only stdout is used, so don't collect stderr
+            text=True,
+            timeout=OSASCRIPT_TIMEOUT
+        )
+    except (subprocess.SubprocessError, OSError):
+        return None
+    if result.returncode == 0 and result.stdout.strip():
+        return result.stdout.strip()
+    return None
+
+
+# A single script finds the frontmost app and asks only that browser for its
+# URL, so one osascript process serves every browser. The browser commands
+# are compiled at run time by `run script`, which keeps the script
+# compilable on machines where one of the browsers isn't installed, and
+# browsers that aren't running are never launched
+_BROWSER_URL_SCRIPT = r'''
+tell application "System Events" to set frontApp to name of first application process whose frontmost is true
+if frontApp is "Google Chrome" then
+    return run script "tell application \"Google Chrome\" to get URL of active tab of front window"
+else if frontApp is "Safari" then
+    return run script "tell application \"Safari\" to get URL of current tab of front window"
+else if frontApp is "Firefox" then
+    return run script "tell application \"Firefox\" to get URL of active tab of front window"
+end if
+return ""
+'''
+
+
+def get_active_url_macos() -> Optional[str]:
+    """Get URL from active browser window on macOS."""
+    return _run_applescript(_BROWSER_URL_SCRIPT)
+
+
+# URL in a Windows window title, matched case-insensitively as PowerShell's
+# -match did. The old "URL followed by dash" and "URL at end after dash"
+# patterns could only match titles this one already matches, so it's the
+# only one needed
+_WINDOWS_URL_PATTERN = re.compile(r'https?://[^ -]+', re.IGNORECASE)
+
+
+def get_active_url_windows() -> Optional[str]:
+    """Get URL from active browser window on Windows."""
+    # Read the foreground window's title through user32 directly, rather than
+    # starting PowerShell and compiling a C# wrapper on every call
+    try:
+        import ctypes
+        user32 = ctypes.windll.user32
+    except (ImportError, AttributeError):
+        return None
+    
+    window = user32.GetForegroundWindow()
+    if not window:
+        return None
+    length = user32.GetWindowTextLengthW(window)
+    buffer = ctypes.create_unicode_buffer(length + 1)
+    user32.GetWindowTextW(window, buffer, length + 1)
+    title = buffer.value
+    
+    # Extract URL from the title
+    url_match = _WINDOWS_URL_PATTERN.search(title)
+    return url_match.group(0) if url_match else None
+
+
+def _active_window_title_xlib() -> Optional[str]:
+    """Read the active window title in-process with python-xlib.
+    
+    Returns None if python-xlib isn't installed or the title can't be read.
+    """
+    try:
+        from Xlib import X, display
+    except ImportError:
+        return None
+    
+    try:
+        xdisplay = display.Display()
+        try:
+            root = xdisplay.screen().root
+            active = root.get_full_property(
+                xdisplay.intern_atom('_NET_ACTIVE_WINDOW'), X.AnyPropertyType
+            )
+            if not active or not active.value:
+                return None
+            window = xdisplay.create_resource_object('window', active.value[0])
+            name = window.get_full_property(xdisplay.intern_atom('_NET_WM_NAME'), 0)
+            if not name:
+                return None
+            title = name.value
+            return title.decode('utf-8', errors='replace') if isinstance(title, bytes) else title
+        finally:
+            xdisplay.close()
+    except Exception:  # Xlib raises its own error types for display/protocol failures
+        return None
+
+# URL in a Linux window title. As on Windows, the "URL followed by dash" and
+# "URL at end after dash" patterns only matched titles this one matches first
+_LINUX_URL_PATTERN = re.compile(r'https?://\S+')
+
+def get_active_url_linux() -> Optional[str]:
+    """Get URL from active browser window on Linux."""
+    # Query X directly when python-xlib is available, avoiding a fork
+    title = _active_window_title_xlib()
+    
+    # Otherwise use xdotool to get window title
+    if title is None:
+        try:
+            # Chain the commands so one xdotool process finds the active
+            # window and prints its title
+            title = subprocess.run(
+                ['xdotool', 'getactivewindow', 'getwindowname'],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True
+            ).stdout.strip()
+        except (subprocess.SubprocessError, FileNotFoundError):
+            return None
+    
+    # Extract URL from the title
+    url_match = _LINUX_URL_PATTERN.search(title)
+    return url_match.group(0).rstrip('- ') if url_match else None
+
+# Resolve the platform's URL getter once rather than on every call
+if sys.platform == 'darwin':
+    _PLATFORM_URL_GETTER = get_active_url_macos
+elif sys.platform == 'win32':
+    _PLATFORM_URL_GETTER = get_active_url_windows
+elif sys.platform.startswith('linux'):
+    _PLATFORM_URL_GETTER = get_active_url_linux
+else:
+    _PLATFORM_URL_GETTER = None
+
+
+def get_active_browser_url() -> Optional[str]:
+    """Get URL from active browser window based on current platform."""
+    if _PLATFORM_URL_GETTER is None:
+        return None
+    return _PLATFORM_URL_GETTER()
+
+# How long to wait for the browser's URL before settling for the clipboard's
+URL_RACE_TIMEOUT = 0.25  # seconds
+
+def race_active_url(
+    clipboard_url: Callable[[], Optional[str]],
+    browser_url: Callable[[], Optional[str]] = get_active_browser_url,
+    timeout: float = URL_RACE_TIMEOUT
+) -> Tuple[Optional[str], Optional[str]]:
+    """Get a URL from the active browser or the clipboard, querying both at once.
+    
+    The browser's URL takes precedence, but a slow browser lookup isn't
+    waited on past timeout when the clipboard already holds a URL. Both
+    lookups should return None rather than raise. Returns the URL and where
+    it came from ('browser' or 'clipboard'), or (None, None).
+    """
+    pool = ThreadPoolExecutor(max_workers=2)
+    browser = pool.submit(browser_url)
+    clipboard = pool.submit(clipboard_url)
+    pool.shutdown(wait=False)
+    
+    try:
+        url = browser.result(timeout=timeout)
+    except FutureTimeoutError:
+        url = None
+    if url:
+        return url, 'browser'
+    
+    url = clipboard.result()
+    if url:
+        return url, 'clipboard'
+    
+    # With nothing in the clipboard, wait for the browser after all
+    url = browser.result()
+    return (url, 'browser') if url else (None, None)
+
+if __name__ == '__main__':
+    # Test the function
+    url = get_active_browser_url()
+    print(f"Active browser URL: {url}") 
\ No newline at end of file
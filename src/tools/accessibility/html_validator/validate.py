@@ -5,9 +5,14 @@ import subprocess
 import sys
 import urllib.parse
 import webbrowser
+from pathlib import Path
 from typing import Optional
 
-import pyperclip
+# Add the src directory to Python path for imports
+script_dir = Path(__file__).resolve().parent
+sys.path.append(str(script_dir.parent.parent.parent))
+
+URL_SCHEMES = ("http://", "https://")
 
 
 def get_active_url_macos() -> Optional[str]:
@@ -31,8 +36,10 @@ def get_active_url_macos() -> Optional[str]:
 def get_url_from_clipboard() -> Optional[str]:
     """Get URL from clipboard with error handling."""
     try:
+        import pyperclip  # Imported here so runs with a URL argument skip it
+
         text = pyperclip.paste()
-        if text and any(text.startswith(prefix) for prefix in ["http://", "https://"]):
+        if text and text.startswith(URL_SCHEMES):
             return text
     except Exception:  # Handle any clipboard-related errors
         pass
@@ -45,20 +52,20 @@ def get_url() -> Optional[str]:
     if len(sys.argv) > 1:
         return sys.argv[1]
 
-    # Then try to get URL from active browser window
-    if sys.platform == "darwin":
-        url = get_active_url_macos()
+    if sys.platform != "darwin":
+        url = get_url_from_clipboard()
         if url:
-            print(f"Found URL in active browser: {url}")
-            return url
-
-    # Finally, try clipboard
-    url = get_url_from_clipboard()
-    if url:
-        print(f"Found URL in clipboard: {url}")
+            print(f"Found URL in clipboard: {url}")
         return url
 
-    return None
+    # Imported here so runs with a URL argument skip it
+    from tools.accessibility.get_active_url import race_active_url
+
+    url, source = race_active_url(get_url_from_clipboard, get_active_url_macos)
+    if url:
+        where = "active browser" if source == "browser" else "clipboard"
+        print(f"Found URL in {where}: {url}")
+    return url
 
 
 def main() -> None:
@@ -8,75 +8,160 @@ and opens the report in Chrome.
 
 import os
 import sys
+import json
+import time
+import argparse
+import contextlib
+import functools
+import hashlib
+import shutil
+import threading
 import subprocess
+import tempfile
 import logging
-import tkinter as tk
-from tkinter import messagebox
+import webbrowser
+from logging.handlers import RotatingFileHandler
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
-import pyperclip
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from dotenv import load_dotenv
 
 # Add parent directory to Python path for imports
 script_dir = Path(__file__).resolve().parent
 sys.path.append(str(script_dir.parent.parent.parent))
-from tools.accessibility.lighthouse.get_active_url import get_active_browser_url
+from tools.accessibility._common import (
+    file_suffix, positive_int, url_domain, urls_from_file
+)
+from tools.accessibility._dialog import show_native_error
 
-# Load environment variables
+# Load environment variables now, as the constants below read them
 load_dotenv()
 
 # Constants
 REPORTS_DIR = Path(os.getenv('LIGHTHOUSE_REPORTS_DIR', str(Path.home() / "lighthouse_reports")))
 LOGS_DIR = REPORTS_DIR / "logs"
-console = Console()
-
-# Set up logging
-LOGS_DIR.mkdir(parents=True, exist_ok=True)
-log_file = LOGS_DIR / f"lighthouse_audit_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(str(log_file)),
-        logging.StreamHandler(sys.stderr)
-    ]
-)
+LOG_FILE = LOGS_DIR / "lighthouse_audit.log"
+REPORT_INDEX = REPORTS_DIR / ".lighthouse-index.json"
+# Categories audited by default. Performance in particular needs a full trace
+# of a throttled page load, so only accessibility is audited unless asked
+CATEGORIES = os.getenv('LIGHTHOUSE_CATEGORIES', "accessibility")
+DEFAULT_CACHE_TTL = 600  # seconds
+STDERR_TAIL_BYTES = 4096  # of Lighthouse's stderr shown when it fails
+TOOL_PATHS_CACHE = Path.home() / '.cache' / 'streamlined-dev-tools' / 'toolpaths.json'
+BROWSER_URL_CACHE = Path.home() / '.cache' / 'streamlined-dev-tools' / 'browser-url.json'
+BROWSER_URL_TTL = 2  # seconds
+
+LOG_MAX_BYTES = 2_000_000
+LOG_BACKUP_COUNT = 5
+
+def setup_logging():
+    """Log to stderr and a shared rotating log file in LOGS_DIR.
+    
+    Called from main() rather than at import, so --help and importing the
+    module don't create log files.
+    """
+    LOGS_DIR.mkdir(parents=True, exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            RotatingFileHandler(
+                str(LOG_FILE),
+                maxBytes=LOG_MAX_BYTES,
+                backupCount=LOG_BACKUP_COUNT
+            ),
+            logging.StreamHandler(sys.stderr)
+        ]
+    )
+
+@functools.lru_cache(maxsize=1)
+def _console():
+    """Create the rich console on first use, keeping rich off the import path."""
+    from rich.console import Console
+    return Console()
 
 def show_error(message: str):
-    """Show error message in a modal dialog."""
-    root = tk.Tk()
-    root.withdraw()  # Hide the main window
-    messagebox.showerror("Lighthouse Audit Error", message)
-    root.destroy()
+    """Show error message in a native dialog, or on the console without one."""
+    if not show_native_error("Lighthouse Audit Error", message):
+        _console().print(f"[red]Error: {message}[/red]")
 
-def find_node_paths() -> Tuple[Optional[Path], Optional[Path]]:
-    """Find npm and lighthouse executables."""
+def _tool_paths_key() -> str:
+    """Key the tool paths cache by $PATH, so a changed PATH probes again."""
+    return hashlib.blake2b(os.environ.get('PATH', '').encode(), digest_size=16).hexdigest()
+
+def _load_tool_paths() -> dict:
     try:
-        # Try using which command first
-        npm_path = subprocess.check_output(['which', 'npm'], text=True).strip()
-        lighthouse_path = subprocess.check_output(['which', 'lighthouse'], text=True).strip()
-        return Path(npm_path), Path(lighthouse_path)
-    except subprocess.CalledProcessError:
-        # If which fails, try common locations
-        common_paths = [
-            Path('/usr/local/bin'),
-            Path('/usr/bin'),
-            Path('/opt/homebrew/bin'),
-            Path.home() / '.npm-global/bin',
-            Path.home() / '.nvm/current/bin'
-        ]
-        
-        for path in common_paths:
-            npm = path / 'npm'
-            lighthouse = path / 'lighthouse'
-            if npm.exists() and lighthouse.exists():
+        return json.loads(TOOL_PATHS_CACHE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+def _save_tool_paths(npm_path: Path, lighthouse_path: Path):
+    """Remember the discovered paths, with lighthouse's mtime to spot reinstalls."""
+    try:
+        cache = _load_tool_paths()
+        cache[_tool_paths_key()] = {
+            'npm': str(npm_path),
+            'lighthouse': str(lighthouse_path),
+            'mtime': lighthouse_path.stat().st_mtime_ns,
+        }
+        TOOL_PATHS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        tmp = TOOL_PATHS_CACHE.with_name(f"{TOOL_PATHS_CACHE.name}.tmp.{os.getpid()}")
+        tmp.write_text(json.dumps(cache))
+        os.replace(tmp, TOOL_PATHS_CACHE)
+    except OSError as e:
+        logging.warning(f"Couldn't cache tool paths: {str(e)}")
+
+@functools.lru_cache(maxsize=1)
+def find_node_paths() -> Tuple[Optional[Path], Optional[Path]]:
+    """Find npm and lighthouse executables.
+    
+    Paths found on an earlier run with the same $PATH are reused as long as
+    both still exist and lighthouse hasn't been reinstalled since.
+    """
+    entry = _load_tool_paths().get(_tool_paths_key())
+    if entry:
+        npm, lighthouse = Path(entry['npm']), Path(entry['lighthouse'])
+        try:
+            if npm.exists() and lighthouse.stat().st_mtime_ns == entry['mtime']:
                 return npm, lighthouse
-        
+        except OSError:
+            pass
+    
+    npm_path, lighthouse_path = _probe_node_paths()
+    if npm_path and lighthouse_path:
+        _save_tool_paths(npm_path, lighthouse_path)
+    return npm_path, lighthouse_path
+
+# Where npm usually installs global binaries, for when they aren't on PATH
+NODE_BIN_DIRS = [
+    Path('/usr/local/bin'),
+    Path('/usr/bin'),
+    Path('/opt/homebrew/bin'),
+    Path.home() / '.npm-global/bin',
+    Path.home() / '.nvm/current/bin'
+]
+
+def _probe_node_paths() -> Tuple[Optional[Path], Optional[Path]]:
+    """Search for npm and lighthouse executables."""
+    # Search PATH in-process rather than spawning `which`
+    npm_path = shutil.which('npm')
+    lighthouse_path = shutil.which('lighthouse')
+    if npm_path and lighthouse_path:
+        return Path(npm_path), Path(lighthouse_path)
+    
+    # Otherwise try common locations
+    bin_dir = next(
+        (
+            path for path in NODE_BIN_DIRS
+            if (path / 'npm').exists() and (path / 'lighthouse').exists()
+        ),
+        None
+    )
+    if bin_dir is None:
         return None, None
+    return bin_dir / 'npm', bin_dir / 'lighthouse'
 
 def check_lighthouse_installation():
     """Check if lighthouse and npm are installed and accessible."""
@@ -108,32 +193,280 @@ def check_lighthouse_installation():
     
     return npm_path, lighthouse_path
 
+URL_SCHEMES = ('http://', 'https://')
+# Clipboard text starting with one of these is taken to be a URL
+URL_PREFIXES = URL_SCHEMES + ('www.',)
+
 def validate_url(url: str) -> str:
     """Validate and format URL."""
-    if not url.startswith(('http://', 'https://')):
+    if not url.startswith(URL_SCHEMES):
         url = f'https://{url}'
     return url
 
 def get_url_from_clipboard() -> Optional[str]:
     """Get URL from clipboard if it looks like a valid URL."""
     try:
+        import pyperclip
         clipboard_content = pyperclip.paste().strip()
-        if any(clipboard_content.startswith(prefix) for prefix in ['http://', 'https://', 'www.']):
+        if clipboard_content.startswith(URL_PREFIXES):
             return clipboard_content
     except Exception as e:
         logging.error(f"Error getting URL from clipboard: {str(e)}")
     return None
 
-def run_lighthouse_audit(url: str) -> Optional[Path]:
-    """Run Lighthouse audit using the Lighthouse CLI."""
+def _load_report_index() -> dict:
+    """Load the index of recent reports, keyed by URL and categories."""
+    try:
+        return json.loads(REPORT_INDEX.read_text())
+    except (OSError, ValueError):
+        return {}
+
+@functools.lru_cache(maxsize=1)
+def _cache_ttl() -> int:
+    """Get how long a report is reused for, in seconds.
+    
+    Read from LIGHTHOUSE_CACHE_TTL when first needed rather than at import,
+    so an invalid value is ignored with a warning instead of crashing.
+    """
+    value = os.getenv('LIGHTHOUSE_CACHE_TTL', str(DEFAULT_CACHE_TTL))
+    try:
+        ttl = int(value)
+    except ValueError:
+        ttl = -1
+    if ttl < 0:
+        logging.warning(f"Ignoring invalid LIGHTHOUSE_CACHE_TTL: {value!r}")
+        return DEFAULT_CACHE_TTL
+    return ttl
+
+def recent_report(url: str, categories: str = CATEGORIES) -> Optional[Path]:
+    """Get a report for the same URL and categories made within the cache TTL."""
+    entry = _load_report_index().get(f"{url}|{categories}")
+    if not entry or time.time() - entry['time'] > _cache_ttl():
+        return None
+    report_path = Path(entry['report'])
+    return report_path if report_path.exists() else None
+
+_report_index_lock = threading.Lock()
+
+def remember_report(url: str, report_path: Path, categories: str = CATEGORIES):
+    """Record a new report in the index, dropping entries that have expired."""
+    with _report_index_lock:
+        _remember_report(url, report_path, categories)
+
+def _remember_report(url: str, report_path: Path, categories: str):
+    now = time.time()
+    ttl = _cache_ttl()
+    index = {
+        key: entry for key, entry in _load_report_index().items()
+        if now - entry['time'] <= ttl
+    }
+    index[f"{url}|{categories}"] = {'report': str(report_path), 'time': now}
+    
+    # Write then rename, so a concurrent run never reads a partial index
+    tmp = REPORT_INDEX.with_name(f"{REPORT_INDEX.name}.tmp.{os.getpid()}")
+    try:
+        tmp.write_text(json.dumps(index))
+        os.replace(tmp, REPORT_INDEX)
+    except OSError as e:
+        logging.warning(f"Couldn't update report index: {str(e)}")
+
+CHROME_PROFILE_DIR = Path.home() / '.cache' / 'streamlined-dev-tools' / 'lighthouse-chrome'
+CHROME_START_TIMEOUT = 10  # seconds
+CHROME_CANDIDATES = [
+    'google-chrome',
+    'google-chrome-stable',
+    'chromium',
+    'chromium-browser',
+    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+    r'C:\Program Files\Google\Chrome\Application\chrome.exe',
+]
+
+def _chrome_port() -> int:
+    """Get the port of a headless Chrome kept running between interactive audits.
+    
+    Read from LIGHTHOUSE_CHROME_PORT; 0 (the default) lets Lighthouse launch
+    (and close) its own Chrome for every audit.
+    """
+    value = os.getenv('LIGHTHOUSE_CHROME_PORT', '0')
+    try:
+        port = int(value)
+    except ValueError:
+        port = -1
+    if not 0 <= port <= 65535:
+        logging.warning(f"Ignoring invalid LIGHTHOUSE_CHROME_PORT: {value!r}")
+        return 0
+    return port
+
+def _chrome_listening(port: int) -> bool:
+    """Check whether a Chrome DevTools endpoint answers on port."""
+    # Only needed when attaching to a long-lived Chrome
+    import urllib.request
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/json/version", timeout=1):
+            return True
+    except (OSError, ValueError):
+        return False
+
+def _find_chrome() -> Optional[str]:
+    """Find a Chrome executable, honouring CHROME_PATH as chrome-launcher does."""
+    candidates = [os.getenv('CHROME_PATH')] + CHROME_CANDIDATES
+    return next((found for found in map(shutil.which, filter(None, candidates)) if found), None)
+
+def _ensure_chrome(port: int) -> bool:
+    """Make sure a headless Chrome is listening on port, starting one if needed.
+    
+    A Chrome started here is left running, so later audits attach to it
+    instead of paying Chrome's start-up again.
+    """
+    if _chrome_listening(port):
+        return True
+    chrome = _find_chrome()
+    if not chrome:
+        logging.warning("Chrome not found, letting Lighthouse launch its own")
+        return False
+    
+    CHROME_PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    subprocess.Popen(
+        [
+            chrome,
+            '--headless=new',
+            f'--remote-debugging-port={port}',
+            f'--user-data-dir={CHROME_PROFILE_DIR}',
+            '--no-first-run',
+            '--no-default-browser-check',
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True  # Outlive this process
+    )
+    deadline = time.monotonic() + CHROME_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if _chrome_listening(port):
+            return True
+        time.sleep(0.1)
+    logging.warning(f"Chrome didn't start listening on port {port}")
+    return False
+
+WORKER_SCRIPT = script_dir / "lighthouse_worker.js"
+
+# Batch runs audit through long-lived Node workers (see lighthouse_worker.js),
+# one per thread, each keeping a single Chrome open across its audits
+_worker_local = threading.local()
+_workers: List[subprocess.Popen] = []
+_workers_lock = threading.Lock()
+_workers_unavailable = os.getenv('LIGHTHOUSE_WORKER') == '0'
+
+def _lighthouse_package_dir(lighthouse_path: Path) -> Optional[Path]:
+    """Find the installed lighthouse package from its CLI executable."""
+    for parent in Path(os.path.realpath(lighthouse_path)).parents:
+        try:
+            if json.loads((parent / 'package.json').read_text()).get('name') == 'lighthouse':
+                return parent
+        except (OSError, ValueError):
+            continue
+    return None
+
+def _get_worker(lighthouse_path: Path) -> Optional[subprocess.Popen]:
+    """Get this thread's Lighthouse worker, starting it on first use.
+    
+    Returns None if no worker can be run, in which case the CLI is used.
+    """
+    worker = getattr(_worker_local, 'worker', None)
+    if worker is not None and worker.poll() is None:
+        return worker
+    
+    node = shutil.which('node')
+    package_dir = _lighthouse_package_dir(lighthouse_path)
+    if _workers_unavailable or not node or not package_dir:
+        return None
+    try:
+        worker = subprocess.Popen(
+            [node, str(WORKER_SCRIPT), str(package_dir)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+            bufsize=1
+        )
+    except OSError:
+        return None
+    _worker_local.worker = worker
+    with _workers_lock:
+        _workers.append(worker)
+    return worker
+
+def _audit_with_worker(url: str, report_path: Path, lighthouse_path: Path,
+                       categories: str) -> Optional[Tuple[bool, str]]:
+    """Audit url with this thread's Lighthouse worker.
+    
+    Returns (succeeded, error message), or None if no worker is available.
+    """
+    global _workers_unavailable
+    worker = _get_worker(lighthouse_path)
+    if worker is None:
+        return None
+    
+    request = {'url': url, 'outPath': str(report_path), 'categories': categories}
+    try:
+        worker.stdin.write(json.dumps(request) + '\n')
+        worker.stdin.flush()
+        reply = worker.stdout.readline()
+    except OSError:
+        reply = ''
+    if not reply:
+        # The worker couldn't start or has died; use the CLI from now on
+        logging.warning("Lighthouse worker exited, falling back to the CLI")
+        _workers_unavailable = True
+        return None
+    try:
+        reply = json.loads(reply)
+        return reply['ok'], reply.get('error', '')
+    except (ValueError, KeyError, TypeError):
+        # Replies carry no request id, so after one unreadable reply the rest
+        # can't be trusted to belong to their URLs
+        logging.warning(
+            f"Lighthouse worker sent an invalid reply, falling back to the CLI: {reply!r}"
+        )
+        worker.kill()
+        _worker_local.worker = None
+        _workers_unavailable = True
+        return None
+
+def _stop_workers():
+    """Close every Lighthouse worker, letting each shut down its Chrome."""
+    with _workers_lock:
+        workers = _workers[:]
+        _workers.clear()
+    for worker in workers:
+        try:
+            worker.stdin.close()
+            worker.wait(timeout=10)
+        except (OSError, subprocess.TimeoutExpired):
+            worker.kill()
+
+@functools.lru_cache(maxsize=1)
+def _ensure_reports_dir():
+    """Create REPORTS_DIR once per process, not once per audit."""
+    REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+
+def run_lighthouse_audit(url: str, report_path: Optional[Path] = None,
+                         interactive: bool = True,
+                         categories: str = CATEGORIES) -> Optional[Path]:
+    """Run Lighthouse audit using the Lighthouse CLI.
+    
+    When interactive is False, as in batch runs, the report isn't opened and
+    errors are printed and logged rather than shown in a dialog.
+    """
+    report_error = show_error if interactive else logging.error
     try:
         # Create reports directory if it doesn't exist
-        REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+        _ensure_reports_dir()
         
         # Generate report filename based on URL and timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        domain = url.replace('https://', '').replace('http://', '').split('/')[0]
-        report_path = REPORTS_DIR / f"lighthouse_{domain}_{timestamp}.html"
+        if report_path is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            report_path = REPORTS_DIR / f"lighthouse_{url_domain(url)}_{timestamp}.html"
         
         # Check lighthouse installation
         npm_path, lighthouse_path = check_lighthouse_installation()
@@ -142,74 +475,233 @@ def run_lighthouse_audit(url: str) -> Optional[Path]:
         
         # Add the binary directory to PATH
         bin_dir = str(lighthouse_path.parent)
-        os.environ['PATH'] = os.pathsep.join([bin_dir, os.environ.get('PATH', '')])
+        path = os.environ.get('PATH', '')
+        if bin_dir not in path.split(os.pathsep):
+            os.environ['PATH'] = os.pathsep.join([bin_dir, path])
         
         # Lighthouse CLI command
         cmd = [
             str(lighthouse_path),
             url,
             '--quiet',  # Reduces output noise
-            '--chrome-flags="--headless"',  # Run Chrome in headless mode
             '--output=html',  # Output format
             '--output-path', str(report_path),
-            '--only-categories=accessibility,best-practices,performance,pwa,seo',  # Categories to audit
-            '--view'  # Automatically open report in browser
+            f'--only-categories={categories}',  # Categories to audit
         ]
+        # Attach to the long-lived Chrome if there is one. Batch runs don't,
+        # as concurrent audits in one Chrome skew each other's results
+        chrome_port = _chrome_port() if interactive else 0
+        if chrome_port and _ensure_chrome(chrome_port):
+            cmd.append(f'--port={chrome_port}')
+        else:
+            # No shell is involved, so the value mustn't be quoted
+            cmd.append('--chrome-flags=--headless=new --disable-gpu')
 
         logging.info(f"Running Lighthouse audit for URL: {url}")
         
-        # Run Lighthouse CLI
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            universal_newlines=True
-        )
-        
-        # Wait for the process to complete
-        stdout, stderr = process.communicate()
+        # Batch runs use a worker that keeps Chrome open between audits
+        outcome = None
+        if not interactive:
+            outcome = _audit_with_worker(url, report_path, lighthouse_path, categories)
+        if outcome is None:
+            # Run Lighthouse CLI. Only stderr is used, for the error message,
+            # so it goes to a temporary file read back only if the run fails
+            with tempfile.TemporaryFile() as stderr_file:
+                # close_fds=False lets CPython start Lighthouse with posix_spawn
+                # rather than fork+exec; fds Python opens are non-inheritable
+                # anyway, so nothing extra leaks into the child
+                process = subprocess.run(
+                    cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=stderr_file,
+                    close_fds=False
+                )
+                details = ''
+                if process.returncode != 0:
+                    # Only the end of stderr is shown, where the error is
+                    size = stderr_file.seek(0, os.SEEK_END)
+                    stderr_file.seek(max(0, size - STDERR_TAIL_BYTES))
+                    details = stderr_file.read().decode('utf-8', errors='replace')
+            outcome = (process.returncode == 0, details)
         
-        if process.returncode != 0:
+        succeeded, details = outcome
+        if not succeeded:
             error_msg = (
                 "Error running Lighthouse audit!\n\n"
-                f"Details: {stderr}\n\n"
+                f"Details: {details}\n\n"
                 "Please try:\n"
                 "1. Checking your internet connection\n"
                 "2. Making sure the URL is accessible\n"
                 "3. Running 'npm install -g lighthouse' in Terminal to update Lighthouse"
             )
-            show_error(error_msg)
-            console.print(f"[red]{error_msg}[/red]")
+            report_error(error_msg)
             return None
 
-        success_msg = f"Report generated and opened in browser:\n{report_path}"
-        console.print(f"[green]{success_msg}[/green]")
+        remember_report(url, report_path, categories)
+        
+        if interactive:
+            # Open the report from a thread rather than with Lighthouse's --view,
+            # so the audit returns without waiting for the browser to launch
+            threading.Thread(target=webbrowser.open, args=(report_path.as_uri(),)).start()
+            success_msg = f"Report generated and opened in browser:\n{report_path}"
+            _console().print(f"[green]{success_msg}[/green]")
         return report_path
         
     except Exception as e:
         error_msg = f"Unexpected error: {str(e)}\n\nPlease try running the audit again."
-        show_error(error_msg)
-        console.print(f"[red]{error_msg}[/red]")
+        report_error(error_msg)
         return None
 
-def get_url() -> Optional[str]:
-    """Get URL from command line, active browser window, or clipboard."""
-    # First, check command line arguments
-    if len(sys.argv) > 1:
-        return sys.argv[1]
+def run_lighthouse_audits(urls: List[str], concurrency: int, use_cache: bool = True,
+                          categories: str = CATEGORIES) -> List[Optional[Path]]:
+    """Audit several URLs, running at most `concurrency` Lighthouse processes at once.
+    
+    Returns the report path for each URL, or None where the audit failed.
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    
+    def audit(url: str) -> Optional[Path]:
+        url = validate_url(url)
+        if use_cache:
+            report_path = recent_report(url, categories)
+            if report_path:
+                return report_path
+        # Batch runs share a timestamp; the pid and counter keep filenames unique
+        report_path = REPORTS_DIR / f"lighthouse_{url_domain(url)}_{timestamp}_{file_suffix()}.html"
+        return run_lighthouse_audit(url, report_path, interactive=False, categories=categories)
+    
+    # Each Lighthouse run launches its own Chrome on a free debugging port,
+    # so concurrent runs don't collide
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            reports = list(pool.map(audit, urls))
+    finally:
+        _stop_workers()
     
-    # Then try to get URL from active browser window
+    for url, report_path in zip(urls, reports):
+        if report_path:
+            _console().print(f"{url}\n  [dim]{report_path}[/dim]")
+        else:
+            _console().print(f"[red]Failed:[/red] {url} (see {LOG_FILE})")
+    return reports
+
+def _cached_browser_url() -> Optional[str]:
+    """Get the active browser's URL, reusing one found in the last BROWSER_URL_TTL.
+    
+    Each Stream Deck press is a new process, so the URL is kept on disk; a
+    quick second press then doesn't run the browser lookup again.
+    """
+    try:
+        entry = json.loads(BROWSER_URL_CACHE.read_text())
+        if 0 <= time.time() - entry['time'] < BROWSER_URL_TTL:
+            return entry['url']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    
+    # Imported here so runs given a URL don't load the browser lookup
+    from tools.accessibility.get_active_url import get_active_browser_url
     url = get_active_browser_url()
+    if url:
+        try:
+            BROWSER_URL_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            tmp = BROWSER_URL_CACHE.with_name(f"{BROWSER_URL_CACHE.name}.tmp.{os.getpid()}")
+            tmp.write_text(json.dumps({'url': url, 'time': time.time()}))
+            os.replace(tmp, BROWSER_URL_CACHE)
+        except OSError as e:
+            logging.warning(f"Couldn't cache browser URL: {str(e)}")
+    return url
+
+def _browser_url_or_none() -> Optional[str]:
+    """Get the active browser's URL, or None if the lookup fails."""
+    try:
+        return _cached_browser_url()
+    except Exception as e:  # The lookup drives platform tools that fail in varied ways
+        logging.warning(f"Couldn't get the active browser's URL: {str(e)}")
+        return None
+
+def get_url(url: Optional[str] = None, prefer_browser: bool = False) -> Optional[str]:
+    """Get URL from command line, clipboard, or active browser window.
+    
+    With prefer_browser, the active browser's URL is used ahead of the
+    clipboard's.
+    """
+    # First, use the command line argument
     if url:
         return url
     
-    # Finally, try clipboard
-    return get_url_from_clipboard()
+    # Reading the clipboard is nearly free while the browser lookup starts a
+    # subprocess, so the browser is only asked when the clipboard has no URL
+    if not prefer_browser:
+        return get_url_from_clipboard() or _browser_url_or_none()
+    
+    from tools.accessibility.get_active_url import race_active_url
+    url, _ = race_active_url(get_url_from_clipboard, _browser_url_or_none)
+    return url
 
 def main():
     """Main function to run the Lighthouse audit."""
+    parser = argparse.ArgumentParser(description='Run a Lighthouse audit.')
+    parser.add_argument(
+        'urls',
+        nargs='*',
+        metavar='url',
+        help='URL(s) to audit (defaults to active browser or clipboard)'
+    )
+    parser.add_argument(
+        '--urls-file',
+        help='also audit every URL listed in this file, one per line'
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=positive_int,
+        default=max(1, (os.cpu_count() or 2) // 2),
+        help='maximum number of audits to run at once when auditing several URLs'
+    )
+    parser.add_argument(
+        '--categories',
+        default=CATEGORIES,
+        help='comma-separated Lighthouse categories to audit (default: %(default)s)'
+    )
+    parser.add_argument(
+        '--prefer-browser',
+        action='store_true',
+        help="use the active browser's URL even if the clipboard holds one"
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='run a fresh audit even if a recent report exists'
+    )
+    args = parser.parse_args()
+    setup_logging()
+    
+    # Look for npm and lighthouse in the background while the URL is found
+    pool = ThreadPoolExecutor(max_workers=1)
+    node_paths = pool.submit(find_node_paths)
+    pool.shutdown(wait=False)
+    
+    urls = list(args.urls)
+    if args.urls_file:
+        try:
+            urls.extend(urls_from_file(args.urls_file))
+        except OSError as e:
+            show_error(f"Couldn't read URLs file {args.urls_file}:\n{e}")
+            sys.exit(1)
+    
+    # Several URLs are audited concurrently, without opening each report
+    if len(urls) > 1:
+        node_paths.result()
+        # Check once here, so a missing install is reported once and not per URL
+        if not all(check_lighthouse_installation()):
+            sys.exit(1)
+        reports = run_lighthouse_audits(
+            urls, args.concurrency, use_cache=not args.no_cache, categories=args.categories
+        )
+        _console().print(f"\n{sum(1 for r in reports if r)} of {len(urls)} audits completed")
+        sys.exit(0 if all(reports) else 1)
+    
     # Get URL from available sources
-    url = get_url()
+    url = get_url(urls[0] if urls else None, prefer_browser=args.prefer_browser)
     if not url:
         error_msg = (
             "No URL found!\n\n"
@@ -220,20 +712,40 @@ def main():
             "Try copying a URL to your clipboard and running this again."
         )
         show_error(error_msg)
-        console.print(f"[red]Error: {error_msg}[/red]")
         sys.exit(1)
     
     # Validate URL
     url = validate_url(url)
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        # Run audit
+    # Reopen a recent report for the same page rather than auditing it again
+    if not args.no_cache:
+        report_path = recent_report(url, args.categories)
+        if report_path:
+            logging.info(f"Reusing recent report for URL: {url}")
+            _console().print(f"[green]Reopening recent report:\n{report_path}[/green]")
+            webbrowser.open(report_path.as_uri())
+            return
+    
+    # The audit re-checks the installation, which is instant once this is done
+    node_paths.result()
+    
+    # Without a terminal (e.g. run from Stream Deck) nobody sees the spinner,
+    # so skip rich's progress display and its refresh thread; the audit is
+    # still logged
+    if sys.stdout.isatty():
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=_console(),
+        )
         progress.add_task(description=f"Running Lighthouse audit for {url}...", total=None)
-        report_path = run_lighthouse_audit(url)
+    else:
+        progress = contextlib.nullcontext()
+    
+    with progress:
+        # Run audit
+        report_path = run_lighthouse_audit(url, categories=args.categories)
         
         if not report_path:
             sys.exit(1)
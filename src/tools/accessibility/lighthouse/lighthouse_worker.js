@@ -0,0 +1,75 @@
+#!/usr/bin/env node
+/**
+ * Long-lived Lighthouse worker used by lighthouse_audit.py for batch runs.
+ *
+ * Launches headless Chrome once, then audits each URL sent on stdin as a
+ * JSON line {url, outPath, categories}, writing the HTML report to outPath
+ * and answering with a JSON line {ok, error}. Chrome is closed when stdin
+ * is closed.
+ *
+ * Usage: node lighthouse_worker.js <lighthouse package directory>
+ */
+'use strict';
+
+const fs = require('fs');
+const path = require('path');
+const readline = require('readline');
+const { createRequire } = require('module');
+const { pathToFileURL } = require('url');
+
+// Import a package by its directory, whether it's an ES or CommonJS module
+async function importPackage(dir) {
+  const pkg = JSON.parse(fs.readFileSync(path.join(dir, 'package.json'), 'utf8'));
+  const mod = await import(pathToFileURL(path.join(dir, pkg.main || 'index.js')).href);
+  return mod.default || mod;
+}
+
+// Find a dependency the way Node would from inside the given package
+function findPackage(name, fromDir) {
+  const lookupPaths = createRequire(path.join(fromDir, 'package.json')).resolve.paths(name);
+  for (const dir of lookupPaths) {
+    if (fs.existsSync(path.join(dir, name, 'package.json'))) {
+      return path.join(dir, name);
+    }
+  }
+  throw new Error(`Cannot find ${name} from ${fromDir}`);
+}
+
+async function main() {
+  const lighthouseDir = process.argv[2];
+  const lighthouse = await importPackage(lighthouseDir);
+  const chromeLauncher = await importPackage(findPackage('chrome-launcher', lighthouseDir));
+  const chrome = await chromeLauncher.launch({ chromeFlags: ['--headless=new', '--disable-gpu'] });
+
+  const lines = readline.createInterface({ input: process.stdin });
+  try {
+    for await (const line of lines) {
+      const { url, outPath, categories } = JSON.parse(line);
+      let reply;
+      try {
+        const result = await lighthouse(url, {
+          port: chrome.port,
+          output: 'html',
+          logLevel: 'error',
+          onlyCategories: categories.split(','),
+        });
+        const runtimeError = result && result.lhr.runtimeError;
+        if (!result || runtimeError) {
+          throw new Error(runtimeError ? runtimeError.message : 'Lighthouse returned no result');
+        }
+        fs.writeFileSync(outPath, result.report);
+        reply = { ok: true };
+      } catch (e) {
+        reply = { ok: false, error: String((e && e.message) || e) };
+      }
+      process.stdout.write(JSON.stringify(reply) + '\n');
+    }
+  } finally {
+    await chrome.kill();
+  }
+}
+
+main().catch((e) => {
+  console.error(e);
+  process.exit(1);
+});
@@ -0,0 +1,261 @@
+"""Tests for the axe-core audit tool."""
+
+import asyncio
+import sys
+import threading
+import types
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import dotenv
+import pytest
+
+from src.tools.accessibility.axe import axe_audit
+from src.tools.accessibility.axe._cache import FileCache
+
+
+def test_store_cache_write_failure_is_not_fatal(tmp_path, capsys):
+    # A cache directory under a regular file can never be created
+    blocker = tmp_path / 'file'
+    blocker.write_text('')
+    axe_audit.store_cache(FileCache(blocker / 'cache'), 'key', {'violations': []})
+    assert "couldn't write the results cache" in capsys.readouterr().out
+
+
+RESULTS = {
+    'violations': [{'impact': 'serious', 'help': 'Images need alt text', 'nodes': []}],
+    'incomplete': [],
+    'passes': 0,
+}
+
+
+def test_results_digest_tracks_results_and_css_mode(monkeypatch):
+    digest = axe_audit.results_digest(RESULTS)
+    assert digest == axe_audit.results_digest(dict(RESULTS))
+    assert digest != axe_audit.results_digest({**RESULTS, 'violations': []})
+    monkeypatch.setenv('AXE_INLINE_CSS', '1')
+    assert digest != axe_audit.results_digest(RESULTS)
+
+
+def test_identical_report(tmp_path):
+    report = tmp_path / 'axe_example.com.html'
+    report.write_text('')
+    index = {'https://example.com/': {'digest': 'abc', 'report': str(report)}}
+    assert axe_audit.identical_report(index, 'https://example.com/', 'abc') == report
+    assert axe_audit.identical_report(index, 'https://example.com/', 'abd') is None
+    assert axe_audit.identical_report(index, 'https://example.org/', 'abc') is None
+    report.unlink()
+    assert axe_audit.identical_report(index, 'https://example.com/', 'abc') is None
+
+
+def test_report_index_round_trip(tmp_path):
+    assert axe_audit.load_report_index(tmp_path) == {}
+    index = {'https://example.com/': {'validator': None, 'digest': 'abc', 'report': 'r.html'}}
+    axe_audit.save_report_index(tmp_path, index)
+    assert axe_audit.load_report_index(tmp_path) == index
+
+
+def test_unchanged_results_reuse_the_last_report(tmp_path, monkeypatch):
+    monkeypatch.setattr(axe_audit, 'stream_axe_results', lambda cmd, log, log_file: RESULTS)
+    monkeypatch.setattr(axe_audit, 'display_terminal_results', lambda results: None)
+    opened = []
+    monkeypatch.setattr(axe_audit, 'open_report', opened.append)
+    logs_dir = tmp_path / 'logs'
+    logs_dir.mkdir()
+
+    url = 'https://example.com/'
+    assert axe_audit.run_axe_audit(url, tmp_path, logs_dir, timestamp='20240101_000000')
+    assert axe_audit.run_axe_audit(url, tmp_path, logs_dir, timestamp='20240101_000001')
+    assert opened[0] == opened[1] == tmp_path / 'axe_example.com_20240101_000000.html'
+    assert len(list(tmp_path.glob('axe_*.html'))) == 1
+
+
+class _FailingPlaywright:
+    """Stands in for async_playwright() when Playwright's browsers are missing."""
+
+    class chromium:
+        @staticmethod
+        async def launch():
+            raise RuntimeError("Executable doesn't exist\nRun playwright install")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+def test_playwright_launch_failure_falls_back_to_the_cli(tmp_path, monkeypatch, capsys):
+    async_api = types.ModuleType('playwright.async_api')
+    async_api.async_playwright = _FailingPlaywright
+    monkeypatch.setitem(sys.modules, 'playwright', types.ModuleType('playwright'))
+    monkeypatch.setitem(sys.modules, 'playwright.async_api', async_api)
+    axe_js = tmp_path / 'axe.min.js'
+    axe_js.write_text('')
+    monkeypatch.setattr(axe_audit, 'find_axe_core_js', lambda: axe_js)
+    cli_audits = []
+
+    async def audit_group(group, sem, logs_dir, timestamp):
+        cli_audits.extend(url for _, url in group)
+        return [RESULTS for _ in group]
+
+    monkeypatch.setattr(axe_audit, '_audit_group', audit_group)
+
+    urls = ['https://example.com/', 'https://example.org/']
+    reports = asyncio.run(axe_audit.run_axe_audit_many(
+        urls, tmp_path, tmp_path, concurrency=2, use_playwright=True
+    ))
+    assert cli_audits == urls
+    assert all(reports)
+    assert "Couldn't launch Playwright's browser" in capsys.readouterr().out
+
+
+@pytest.fixture
+def dotenv_file(tmp_path, monkeypatch):
+    """Point load_dotenv at a .env file in tmp_path, with AXE_OUTPUT_FORMAT unset."""
+    monkeypatch.setenv('AXE_OUTPUT_FORMAT', '')
+    monkeypatch.delenv('AXE_OUTPUT_FORMAT')
+    path = tmp_path / '.env'
+    load_dotenv = dotenv.load_dotenv
+    monkeypatch.setattr(dotenv, 'load_dotenv', lambda: load_dotenv(path))
+    return path
+
+
+def test_output_format_default_is_read_from_dotenv(dotenv_file):
+    dotenv_file.write_text('AXE_OUTPUT_FORMAT=terminal\n')
+    assert axe_audit.parse_args([]).output == 'terminal'
+    assert axe_audit.parse_args(['--output', 'html']).output == 'html'
+
+
+def test_invalid_output_format_from_env_is_rejected(dotenv_file, capsys):
+    dotenv_file.write_text('AXE_OUTPUT_FORMAT=pdf\n')
+    with pytest.raises(SystemExit):
+        axe_audit.parse_args([])
+    assert "AXE_OUTPUT_FORMAT must be one of html, terminal, not 'pdf'" in capsys.readouterr().err
+
+
+class _FakePage:
+    async def goto(self, url, timeout):
+        pass
+
+    async def evaluate(self, script):
+        if script == 'axe.run()':
+            return {'violations': [], 'incomplete': [], 'passes': [{}]}
+        return None
+
+    async def close(self):
+        pass
+
+
+class _FakeBrowser:
+    """A browser whose first new_page() call fails."""
+
+    def __init__(self):
+        self.pages_opened = 0
+
+    async def new_page(self):
+        self.pages_opened += 1
+        if self.pages_opened == 1:
+            raise RuntimeError('Target page, context or browser has been closed')
+        return _FakePage()
+
+    async def close(self):
+        pass
+
+
+class _WorkingPlaywright(_FailingPlaywright):
+    class chromium:
+        @staticmethod
+        async def launch():
+            return _FakeBrowser()
+
+
+def test_playwright_page_failure_only_fails_that_url(tmp_path, monkeypatch, capsys):
+    async_api = types.ModuleType('playwright.async_api')
+    async_api.async_playwright = _WorkingPlaywright
+    monkeypatch.setitem(sys.modules, 'playwright', types.ModuleType('playwright'))
+    monkeypatch.setitem(sys.modules, 'playwright.async_api', async_api)
+    axe_js = tmp_path / 'axe.min.js'
+    axe_js.write_text('')
+
+    pending = [(0, 'https://example.com/'), (1, 'https://example.org/')]
+    pages = asyncio.run(axe_audit._audit_with_playwright(
+        pending, 1, axe_js, tmp_path, '20240101_000000'
+    ))
+    assert pages[0] is None
+    assert pages[1] == {'violations': [], 'incomplete': [], 'passes': 1}
+    [log_file] = tmp_path.glob('axe_audit_20240101_000000_*.log')
+    assert 'has been closed' in log_file.read_text()
+    assert 'https://example.com/' in capsys.readouterr().out
+
+
+SITEMAP_NS = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+
+
+def _urlset(*locs):
+    urls = ''.join(f'<url><loc>{loc}</loc></url>' for loc in locs)
+    return f'<urlset xmlns="{SITEMAP_NS}">{urls}</urlset>'
+
+
+def _sitemap_index(*locs):
+    sitemaps = ''.join(f'<sitemap><loc>{loc}</loc></sitemap>' for loc in locs)
+    return f'<sitemapindex xmlns="{SITEMAP_NS}">{sitemaps}</sitemapindex>'
+
+
+@pytest.fixture
+def sitemap_server():
+    """Serve the documents in the returned dict, keyed by path."""
+    documents = {}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = documents.get(self.path)
+            if body is None:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/xml')
+            self.end_headers()
+            self.wfile.write(body.format(base=base).encode())
+
+        def log_message(self, format, *args):
+            pass
+
+    httpd = HTTPServer(('127.0.0.1', 0), Handler)
+    base = f'http://127.0.0.1:{httpd.server_port}'
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield base, documents
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_urls_from_sitemap(sitemap_server):
+    base, documents = sitemap_server
+    documents['/sitemap.xml'] = _urlset('https://example.com/', 'https://example.com/about')
+    assert axe_audit.urls_from_sitemap(f'{base}/sitemap.xml') == [
+        'https://example.com/', 'https://example.com/about'
+    ]
+
+
+def test_urls_from_sitemap_follows_sitemap_indexes(sitemap_server, capsys):
+    base, documents = sitemap_server
+    documents['/index.xml'] = _sitemap_index(
+        '{base}/pages.xml', '{base}/nested.xml', '{base}/missing.xml', '{base}/index.xml'
+    )
+    documents['/pages.xml'] = _urlset('https://example.com/a')
+    documents['/nested.xml'] = _sitemap_index('{base}/deep.xml')
+    documents['/deep.xml'] = _sitemap_index('{base}/too-deep.xml')
+    documents['/too-deep.xml'] = _urlset('https://example.com/never')
+
+    # Sitemap URLs are followed, never audited, and the cycle back to the
+    # index and the levels past SITEMAP_MAX_DEPTH are skipped
+    assert axe_audit.urls_from_sitemap(f'{base}/index.xml') == ['https://example.com/a']
+    output = capsys.readouterr().out
+    assert 'missing.xml' in output
+    assert 'too-deep.xml' in output
+
+
+def test_urls_from_sitemap_rejects_invalid_xml(sitemap_server):
+    base, documents = sitemap_server
+    documents['/sitemap.xml'] = 'not <xml'
+    with pytest.raises(ValueError):
+        axe_audit.urls_from_sitemap(f'{base}/sitemap.xml')
@@ -0,0 +1,92 @@
+"""Tests for the axe-core results cache."""
+
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from src.tools.accessibility.axe._cache import FileCache, cache_key, fingerprint_url
+
+
+class _PageHandler(BaseHTTPRequestHandler):
+    """Serve a fixed body, with an ETag only under /etag."""
+
+    body = b'<html>hello</html>'
+
+    def _send_headers(self):
+        self.send_response(200)
+        if self.path == '/etag':
+            self.send_header('ETag', '"v1"')
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+
+    def do_HEAD(self):
+        self._send_headers()
+
+    def do_GET(self):
+        self._send_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = HTTPServer(('127.0.0.1', 0), _PageHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{httpd.server_port}'
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_file_cache_round_trip(tmp_path):
+    cache = FileCache(tmp_path / 'cache')
+    assert cache.get('key') is None
+    cache.set('key', b'{"violations": []}')
+    assert cache.get('key') == b'{"violations": []}'
+    # The write goes through a temporary file that is renamed into place
+    assert [p.name for p in (tmp_path / 'cache').iterdir()] == ['key.json']
+
+
+def test_file_cache_expires_entries(tmp_path):
+    cache = FileCache(tmp_path, ttl=60)
+    cache.set('key', b'data')
+    old = time.time() - 61
+    os.utime(tmp_path / 'key.json', (old, old))
+    assert cache.get('key') is None
+
+
+def test_file_cache_clear(tmp_path):
+    cache = FileCache(tmp_path / 'cache')
+    cache.set('key', b'data')
+    cache.clear()
+    assert cache.get('key') is None
+    assert not (tmp_path / 'cache').exists()
+
+
+def test_cache_key_depends_on_url_and_fingerprint():
+    key = cache_key('https://example.com/', 'abc')
+    assert key == cache_key('https://example.com/', 'abc')
+    assert key != cache_key('https://example.com/', 'abd')
+    assert key != cache_key('https://example.org/', 'abc')
+    assert len(key) == 64
+
+
+def test_fingerprint_url_prefers_validator(server):
+    assert fingerprint_url(f'{server}/etag') == '"v1"'
+
+
+def test_fingerprint_url_falls_back_to_body_hash(server):
+    fingerprint = fingerprint_url(f'{server}/plain')
+    assert fingerprint == fingerprint_url(f'{server}/other')
+    assert len(fingerprint) == 64
+
+
+def test_fingerprint_url_unreachable_page():
+    with HTTPServer(('127.0.0.1', 0), _PageHandler) as httpd:
+        port = httpd.server_port
+    assert fingerprint_url(f'http://127.0.0.1:{port}/', timeout=1) is None
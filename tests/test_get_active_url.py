@@ -0,0 +1,34 @@
+"""Tests for the active browser URL lookup."""
+
+import time
+
+from src.tools.accessibility import get_active_url
+
+BROWSER = 'https://example.com/'
+CLIPBOARD = 'https://example.org/'
+
+
+def _slow(url):
+    def lookup():
+        time.sleep(0.5)
+        return url
+    return lookup
+
+
+def test_race_prefers_the_browser():
+    race = get_active_url.race_active_url(lambda: CLIPBOARD, lambda: BROWSER)
+    assert race == (BROWSER, 'browser')
+
+
+def test_race_settles_for_the_clipboard_when_the_browser_is_slow():
+    race = get_active_url.race_active_url(lambda: CLIPBOARD, _slow(BROWSER), timeout=0.05)
+    assert race == (CLIPBOARD, 'clipboard')
+
+
+def test_race_waits_for_the_browser_when_the_clipboard_is_empty():
+    race = get_active_url.race_active_url(lambda: None, _slow(BROWSER), timeout=0.05)
+    assert race == (BROWSER, 'browser')
+
+
+def test_race_without_a_url():
+    assert get_active_url.race_active_url(lambda: None, lambda: None) == (None, None)
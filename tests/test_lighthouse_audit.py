@@ -0,0 +1,189 @@
+"""Tests for the Lighthouse audit tool."""
+
+import io
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from src.tools.accessibility.lighthouse import lighthouse_audit
+
+URL = 'https://example.com/'
+
+
+@pytest.fixture
+def report_index(tmp_path, monkeypatch):
+    index = tmp_path / '.lighthouse-index.json'
+    monkeypatch.setattr(lighthouse_audit, 'REPORT_INDEX', index)
+    monkeypatch.setenv('LIGHTHOUSE_CACHE_TTL', '600')
+    lighthouse_audit._cache_ttl.cache_clear()
+    yield index
+    lighthouse_audit._cache_ttl.cache_clear()
+
+
+@pytest.fixture
+def report(tmp_path):
+    path = tmp_path / 'lighthouse_example.com.html'
+    path.write_text('')
+    return path
+
+
+def test_recent_report_is_reused_within_ttl(report_index, report):
+    lighthouse_audit.remember_report(URL, report, 'accessibility')
+    assert lighthouse_audit.recent_report(URL, 'accessibility') == report
+    assert lighthouse_audit.recent_report(URL, 'accessibility,seo') is None
+    assert lighthouse_audit.recent_report('https://example.org/', 'accessibility') is None
+
+
+def test_recent_report_expires_after_ttl(report_index, report):
+    entry = {'report': str(report), 'time': time.time() - 601}
+    report_index.write_text(json.dumps({f'{URL}|accessibility': entry}))
+    assert lighthouse_audit.recent_report(URL, 'accessibility') is None
+
+
+def test_recent_report_ignores_deleted_reports(report_index, report):
+    lighthouse_audit.remember_report(URL, report, 'accessibility')
+    report.unlink()
+    assert lighthouse_audit.recent_report(URL, 'accessibility') is None
+
+
+def test_remember_report_drops_expired_entries(report_index, report):
+    expired = {'report': str(report), 'time': time.time() - 601}
+    report_index.write_text(json.dumps({'https://example.org/|accessibility': expired}))
+    lighthouse_audit.remember_report(URL, report, 'accessibility')
+    assert list(json.loads(report_index.read_text())) == [f'{URL}|accessibility']
+
+
+def test_batch_report_names_are_unique(tmp_path, monkeypatch):
+    monkeypatch.setattr(lighthouse_audit, 'REPORTS_DIR', tmp_path)
+    monkeypatch.setattr(
+        lighthouse_audit, 'run_lighthouse_audit',
+        lambda url, report_path, interactive, categories: report_path
+    )
+    # The same URL twice, started in the same second, still gets two reports
+    reports = lighthouse_audit.run_lighthouse_audits([URL, URL], concurrency=2, use_cache=False)
+    assert len(set(reports)) == 2
+    assert all(f'_{os.getpid()}_' in report.name for report in reports)
+
+
+def _failing_installation_check():
+    raise RuntimeError('lighthouse exploded')
+
+
+def test_interactive_audit_error_is_printed_once(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(lighthouse_audit, 'show_native_error', lambda title, message: False)
+    monkeypatch.setattr(
+        lighthouse_audit, 'check_lighthouse_installation', _failing_installation_check
+    )
+    report_path = tmp_path / 'report.html'
+    assert lighthouse_audit.run_lighthouse_audit(URL, report_path, interactive=True) is None
+    assert capsys.readouterr().out.count('lighthouse exploded') == 1
+
+
+def test_batch_audit_error_is_logged_once(tmp_path, monkeypatch, capsys, caplog):
+    monkeypatch.setattr(
+        lighthouse_audit, 'check_lighthouse_installation', _failing_installation_check
+    )
+    report_path = tmp_path / 'report.html'
+    assert lighthouse_audit.run_lighthouse_audit(URL, report_path, interactive=False) is None
+    assert 'lighthouse exploded' not in capsys.readouterr().out
+    assert [r.getMessage().count('lighthouse exploded') for r in caplog.records] == [1]
+
+
+@pytest.mark.parametrize('value, port', [('9222', 9222), ('0', 0), (None, 0)])
+def test_chrome_port(monkeypatch, value, port):
+    if value is None:
+        monkeypatch.delenv('LIGHTHOUSE_CHROME_PORT', raising=False)
+    else:
+        monkeypatch.setenv('LIGHTHOUSE_CHROME_PORT', value)
+    assert lighthouse_audit._chrome_port() == port
+
+
+@pytest.mark.parametrize('value', ['abc', '-1', '70000', ''])
+def test_invalid_chrome_port_is_ignored(monkeypatch, caplog, value):
+    monkeypatch.setenv('LIGHTHOUSE_CHROME_PORT', value)
+    assert lighthouse_audit._chrome_port() == 0
+    assert 'Ignoring invalid LIGHTHOUSE_CHROME_PORT' in caplog.text
+
+
+@pytest.mark.parametrize('value, ttl', [('300', 300), ('0', 0), ('abc', 600), ('-5', 600)])
+def test_cache_ttl(monkeypatch, caplog, value, ttl):
+    monkeypatch.setenv('LIGHTHOUSE_CACHE_TTL', value)
+    lighthouse_audit._cache_ttl.cache_clear()
+    try:
+        assert lighthouse_audit._cache_ttl() == ttl
+    finally:
+        lighthouse_audit._cache_ttl.cache_clear()
+    assert ('Ignoring invalid LIGHTHOUSE_CACHE_TTL' in caplog.text) == (value in ('abc', '-5'))
+
+
+def test_help_runs_with_an_invalid_cache_ttl():
+    env = {**os.environ, 'LIGHTHOUSE_CACHE_TTL': 'abc'}
+    result = subprocess.run(
+        [sys.executable, lighthouse_audit.__file__, '--help'],
+        env=env, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_help_runs_with_an_invalid_chrome_port():
+    env = {**os.environ, 'LIGHTHOUSE_CHROME_PORT': 'abc'}
+    result = subprocess.run(
+        [sys.executable, lighthouse_audit.__file__, '--help'],
+        env=env, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def _failing_browser_lookup():
+    raise RuntimeError('osascript failed')
+
+
+@pytest.mark.parametrize('prefer_browser', [True, False])
+def test_get_url_falls_back_when_browser_lookup_fails(monkeypatch, caplog, prefer_browser):
+    monkeypatch.setattr(lighthouse_audit, '_cached_browser_url', _failing_browser_lookup)
+    monkeypatch.setattr(lighthouse_audit, 'get_url_from_clipboard', lambda: None)
+    assert lighthouse_audit.get_url(prefer_browser=prefer_browser) is None
+    assert "Couldn't get the active browser's URL" in caplog.text
+
+    monkeypatch.setattr(lighthouse_audit, 'get_url_from_clipboard', lambda: URL)
+    assert lighthouse_audit.get_url(prefer_browser=prefer_browser) == URL
+
+
+class _FakeWorker:
+    """Stands in for a Lighthouse worker process that answers with reply."""
+
+    def __init__(self, reply):
+        self.stdin = io.StringIO()
+        self.stdout = io.StringIO(reply)
+        self.killed = False
+
+    def kill(self):
+        self.killed = True
+
+
+@pytest.mark.parametrize('reply', ['not json\n', '{"error": "no ok key"}\n', '[true]\n'])
+def test_invalid_worker_reply_falls_back_to_the_cli(tmp_path, monkeypatch, caplog, reply):
+    worker = _FakeWorker(reply)
+    monkeypatch.setattr(lighthouse_audit, '_get_worker', lambda lighthouse_path: worker)
+    monkeypatch.setattr(lighthouse_audit, '_workers_unavailable', False)
+    outcome = lighthouse_audit._audit_with_worker(
+        URL, tmp_path / 'report.html', tmp_path / 'lighthouse', 'accessibility'
+    )
+    assert outcome is None
+    assert worker.killed
+    assert lighthouse_audit._workers_unavailable
+    assert 'invalid reply' in caplog.text
+
+
+def test_worker_reply_is_returned(tmp_path, monkeypatch):
+    worker = _FakeWorker('{"ok": false, "error": "page failed"}\n')
+    monkeypatch.setattr(lighthouse_audit, '_get_worker', lambda lighthouse_path: worker)
+    outcome = lighthouse_audit._audit_with_worker(
+        URL, tmp_path / 'report.html', tmp_path / 'lighthouse', 'accessibility'
+    )
+    assert outcome == (False, 'page failed')
+    assert json.loads(worker.stdin.getvalue())['url'] == URL